@@ -9,11 +9,10 @@ from typing import Any, Dict, Optional
 from uuid import uuid4
 
 from fastapi import FastAPI, HTTPException
-from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse
 
-from regtech_agent import run_regulation_agent
+from regtech_agent import arun_regulation_agent
 
 from .schemas import (
     AnalysisRecord,
@@ -135,8 +134,7 @@ async def analyze_regulations(
     analysis_id = uuid4().hex[:8]
 
     try:
-        final_state = await run_in_threadpool(
-            run_regulation_agent,
+        final_state = await arun_regulation_agent(
             business_payload,
             request.email_recipients,
         )
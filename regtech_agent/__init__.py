@@ -18,7 +18,12 @@ from .models import (
     AgentState
 )
 
-from .workflow import build_workflow, run_regulation_agent
+from .workflow import (
+    build_workflow,
+    run_regulation_agent,
+    arun_regulation_agent,
+    astream_regulation_agent
+)
 
 __version__ = "2.0.0"
 __all__ = [
@@ -35,5 +40,7 @@ __all__ = [
     "RiskAssessment",
     "AgentState",
     "build_workflow",
-    "run_regulation_agent"
+    "run_regulation_agent",
+    "arun_regulation_agent",
+    "astream_regulation_agent"
 ]
@@ -2,31 +2,28 @@
 Analyzer Agent - 사업 정보 분석 및 키워드 추출
 """
 
+import logging
+import re
 from typing import Dict, Any
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI
+from langchain_core.tools import StructuredTool
 
 from ..models import BusinessInfo
+from ..utils import LIGHT_LLM_MODEL, get_llm
 
+logger = logging.getLogger(__name__)
 
-@tool
-def analyze_business(business_info: BusinessInfo) -> Dict[str, Any]:
-    """사업 정보를 분석하여 규제 검색용 키워드를 추출합니다.
+# 키워드 구분자 (쉼표 또는 줄바꿈)
+_KEYWORD_SPLIT_RE = re.compile(r"[,\n]")
 
-    Args:
-        business_info: 사업 정보 (업종, 제품명, 원자재 등)
 
-    Returns:
-        추출된 키워드 목록
-    """
-    print("🔍 [Analyzer Agent] 사업 정보 분석 중...")
-    print(f"   업종: {business_info['industry']}")
-    print(f"   제품: {business_info['product_name']}")
-    print(f"   원자재: {business_info['raw_materials']}")
+def _build_prompt(business_info: BusinessInfo) -> str:
+    """키워드 추출 프롬프트를 만듭니다 (동기/비동기 경로 공용)."""
+    logger.info("🔍 [Analyzer Agent] 사업 정보 분석 중...")
+    logger.info("   업종: %s", business_info['industry'])
+    logger.info("   제품: %s", business_info['product_name'])
+    logger.info("   원자재: %s", business_info['raw_materials'])
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-
-    prompt = f"""
+    return f"""
 다음 사업 정보를 분석하여 규제 검색에 필요한 핵심 키워드를 추출하세요.
 
 업종: {business_info['industry']}
@@ -45,9 +42,41 @@ def analyze_business(business_info: BusinessInfo) -> Dict[str, Any]:
 예시: 배터리, 화학물질, 산업안전, 제품인증, 유해물질
 """
 
-    response = llm.invoke(prompt)
-    keywords = [k.strip() for k in response.content.split(',')]
 
-    print(f"   ✓ 추출된 키워드 ({len(keywords)}개): {keywords}\n")
+def _parse_keywords(content: str) -> Dict[str, Any]:
+    """LLM 응답에서 키워드 목록을 추출합니다."""
+    # 빈 항목(끝 쉼표, 줄바꿈 구분 등)은 검색 쿼리에 쓸모가 없으므로 제외
+    keywords = [k.strip() for k in _KEYWORD_SPLIT_RE.split(content) if k.strip()]
+
+    logger.info("   ✓ 추출된 키워드 (%d개): %s", len(keywords), keywords)
 
     return {"keywords": keywords}
+
+
+async def _aanalyze_business(business_info: BusinessInfo) -> Dict[str, Any]:
+    """_analyze_business의 비동기 버전."""
+    prompt = _build_prompt(business_info)
+    # 키워드 나열만 하면 되므로 경량 모델 사용
+    response = await get_llm(0, model=LIGHT_LLM_MODEL).ainvoke(prompt)
+    return _parse_keywords(response.content)
+
+
+def _analyze_business(business_info: BusinessInfo) -> Dict[str, Any]:
+    """사업 정보를 분석하여 규제 검색용 키워드를 추출합니다.
+
+    Args:
+        business_info: 사업 정보 (업종, 제품명, 원자재 등)
+
+    Returns:
+        추출된 키워드 목록
+    """
+    prompt = _build_prompt(business_info)
+    response = get_llm(0, model=LIGHT_LLM_MODEL).invoke(prompt)
+    return _parse_keywords(response.content)
+
+
+analyze_business = StructuredTool.from_function(
+    func=_analyze_business,
+    coroutine=_aanalyze_business,
+    name="analyze_business",
+)
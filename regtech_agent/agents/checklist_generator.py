@@ -2,76 +2,48 @@
 Checklist Generator Agent - 규제별 체크리스트 생성
 """
 
-from typing import Dict, Any, List
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI
-import json
+import logging
+from typing import Dict, Any, List, Sequence, Tuple
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.tools import StructuredTool
 from datetime import datetime
 
-from ..models import Regulation
-from ..utils import normalize_evidence_payload, ensure_dict_list
-
-
-@tool
-def generate_checklists(regulations: List[Regulation]) -> Dict[str, Any]:
-    """각 규제에 대한 실행 가능한 체크리스트를 생성합니다.
-
-    Args:
-        regulations: 우선순위가 결정된 규제 목록
-
-    Returns:
-        체크리스트 항목 목록
-    """
-    print("📝 [Checklist Generator Agent] 규제별 체크리스트 생성 중...")
-
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
-
-    all_checklists = []
-
-    # 현재 시스템 시간 가져오기
-    current_date = datetime.now().strftime("%Y-%m-%d")
-
-    for reg in regulations:
-        print(f"   {reg['name']} - 체크리스트 생성 중...")
-
-        source_summary = "\n".join([
-            f"{src.get('source_id','-')} | {src.get('title','제목 없음')}\nURL: {src.get('url','')}\n발췌: {src.get('snippet','')}"
-            for src in reg.get('sources', [])
-        ]) or "등록된 출처 없음"
-
-        prompt = f"""
-다음 규제를 준수하기 위한 실행 가능한 체크리스트를 생성하세요.
+from ..models import ChecklistItem, Regulation
+from ..utils import (
+    MALFORMED_RESPONSE_ERRORS,
+    REGULATIONS_PER_PROMPT,
+    chunked,
+    format_source_summary,
+    get_llm,
+    llm_max_concurrency,
+    normalize_evidence_payload,
+    ensure_dict_list,
+    parse_llm_json
+)
+
+logger = logging.getLogger(__name__)
+
+
+# 고정 지시문/출력 스키마 (모든 규제·실행에서 동일한 system 메시지 → OpenAI 프롬프트 접두사 캐시 대상)
+_SYSTEM_MESSAGE = SystemMessage(content="""
+사용자가 제공하는 각 규제를 준수하기 위한 실행 가능한 체크리스트를 규제별로 생성하세요.
 각 작업마다 실제 인터넷 출처(source_id)를 evidence 배열에 포함해야 합니다.
 
-[규제 정보]
-규제명: {reg['name']}
-카테고리: {reg['category']}
-관할 기관: {reg['authority']}
-우선순위: {reg['priority']}
-적용 이유: {reg['why_applicable']}
-주요 요구사항:
-{chr(10).join('  - ' + req for req in reg['key_requirements'])}
-
-[사용 가능한 출처]
-{source_summary}
-
-[현재 날짜]
-{current_date}
-
 [생성 지침]
 1) 작업 수: 3~5개.
 2) method[0]에는 "(매핑: 요구사항 N)" 형식으로 매핑 정보를 기재합니다.
-3) evidence에는 [사용 가능한 출처]에서 선택한 source_id와 해당 출처의 핵심 문장을 1~2개 포함합니다.
+3) evidence에는 해당 규제의 [사용 가능한 출처]에서 선택한 source_id와 해당 출처의 핵심 문장을 1~2개 포함합니다.
 4) method 단계는 3~5개, 마지막 단계에는 증빙/기록 확보를 포함합니다.
-5) deadline은 현재 날짜({current_date})를 기준으로 우선순위에 맞게 YYYY-MM-DD 형식으로 계산합니다.
+5) deadline은 [현재 날짜]를 기준으로 우선순위에 맞게 YYYY-MM-DD 형식으로 계산합니다.
    - HIGH: 현재일 + 1~3개월
    - MEDIUM: 현재일 + 3~6개월
    - LOW: 현재일 + 6~12개월
 6) estimated_time은 실제 소요 시간을 구체적으로 작성합니다 (예: "2주", "1개월").
-7) JSON 배열 외 텍스트는 금지합니다.
+7) {"REG-001": [...], "REG-002": [...]} 형태의 JSON 객체로만 출력합니다.
+   키는 제공된 모든 규제의 규제 ID이고, 배열의 각 항목은 [출력 스키마]를 따릅니다.
 
 [출력 스키마]
-{{
+{
   "task_name": "구체적인 작업명(명령형)",
   "responsible_dept": "담당 부서",
   "deadline": "YYYY-MM-DD",
@@ -84,67 +56,198 @@ def generate_checklists(regulations: List[Regulation]) -> Dict[str, Any]:
   ],
   "estimated_time": "소요 시간",
   "evidence": [
-    {{
+    {
       "source_id": "SRC-001",
       "justification": "출처에서 확인한 핵심 문장"
-    }}
+    }
   ]
-}}
-"""
+}
+""")
 
-        response = llm.invoke(prompt)
+# 묶음 입력 템플릿 (현재 날짜 + 규제별 블록)
+_PROMPT_TMPL = """
+[현재 날짜]
+{current_date}
+{regulation_sections}""".format
 
+# 규제별 입력 블록 템플릿 (모듈 로드 시 1회 구성)
+_REG_SECTION_TMPL = """
+[규제 정보]
+규제 ID: {id}
+규제명: {name}
+카테고리: {category}
+관할 기관: {authority}
+우선순위: {priority}
+적용 이유: {why_applicable}
+주요 요구사항:
+{requirements}
+
+[사용 가능한 출처]
+{source_summary}
+""".format
+
+
+def _build_prompt(regs: Sequence[Regulation], current_date: str) -> List[BaseMessage]:
+    """규제 묶음에 대한 체크리스트 생성 메시지 (고정 system + 묶음별 user)를 만듭니다."""
+    regulation_sections = "".join(
+        _REG_SECTION_TMPL(
+            id=reg['id'],
+            name=reg['name'],
+            category=reg['category'],
+            authority=reg['authority'],
+            priority=reg['priority'],
+            why_applicable=reg['why_applicable'],
+            requirements="\n".join('  - ' + req for req in reg['key_requirements']),
+            source_summary=format_source_summary(reg.get('sources', [])),
+        )
+        for reg in regs
+    )
+    return [
+        _SYSTEM_MESSAGE,
+        HumanMessage(content=_PROMPT_TMPL(
+            current_date=current_date,
+            regulation_sections=regulation_sections,
+        )),
+    ]
+
+
+def _parse_checklists(reg: Regulation, raw_payload: Any) -> List[ChecklistItem]:
+    """규제 하나에 해당하는 응답 부분을 ChecklistItem 목록으로 변환합니다."""
+    checklist_items = ensure_dict_list(raw_payload)
+
+    if not checklist_items:
+        logger.warning("      ⚠️  %s 체크리스트 응답이 비어 있거나 형식이 올바르지 않습니다.", reg['name'])
+        return []
+
+    source_lookup = {
+        src.get("source_id"): src for src in reg.get("sources", [])
+        if src.get("source_id")
+    }
+
+    # ChecklistItem 형식으로 변환
+    checklists: List[ChecklistItem] = []
+    for item in checklist_items:
+        if not isinstance(item, dict):
+            continue
+
+        evidence_entries = normalize_evidence_payload(
+            item.get("evidence"),
+            source_lookup
+        )
+
+        method_steps = item.get("method") or []
+        if isinstance(method_steps, str):
+            method_steps = [method_steps]
+
+        checklists.append({
+            "regulation_id": reg['id'],
+            "regulation_name": reg['name'],
+            "task_name": item.get("task_name", ""),
+            "responsible_dept": item.get("responsible_dept", "담당 부서"),
+            "deadline": item.get("deadline", "미정"),
+            "method": method_steps,
+            "estimated_time": item.get("estimated_time", "미정"),
+            "priority": reg['priority'],
+            "status": "pending",
+            "evidence": evidence_entries
+        })
+
+    return checklists
+
+
+def _parse_chunk(regs: Sequence[Regulation], raw_content: str) -> List[ChecklistItem]:
+    """규제 ID를 키로 하는 LLM 응답을 묶음 내 규제별 ChecklistItem 목록으로 변환합니다."""
+    try:
+        # JSON 파싱
+        raw_payload = parse_llm_json(raw_content)
+    except MALFORMED_RESPONSE_ERRORS as e:
+        logger.warning("      ⚠️  JSON 파싱 오류: %s", e)
+        return []
+
+    if not isinstance(raw_payload, dict):
+        raw_payload = {}
+
+    checklists: List[ChecklistItem] = []
+    for reg in regs:
+        reg_payload = raw_payload.get(reg['id'])
+        # 규제 하나만 보낸 묶음에서 ID 없이 답한 경우 ({"checklists": [...]} 등)
+        if reg_payload is None and len(regs) == 1:
+            reg_payload = raw_payload
         try:
-            # JSON 파싱
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-
-            raw_payload = json.loads(content.strip())
-            checklist_items = ensure_dict_list(raw_payload)
-
-            if not checklist_items:
-                print("      ⚠️  체크리스트 응답이 비어 있거나 형식이 올바르지 않습니다.")
-                continue
-
-            source_lookup = {
-                src.get("source_id"): src for src in reg.get("sources", [])
-                if src.get("source_id")
-            }
-
-            # ChecklistItem 형식으로 변환
-            for item in checklist_items:
-                if not isinstance(item, dict):
-                    continue
-
-                evidence_entries = normalize_evidence_payload(
-                    item.get("evidence"),
-                    source_lookup
-                )
-
-                method_steps = item.get("method") or []
-                if isinstance(method_steps, str):
-                    method_steps = [method_steps]
-
-                all_checklists.append({
-                    "regulation_id": reg['id'],
-                    "regulation_name": reg['name'],
-                    "task_name": item.get("task_name", ""),
-                    "responsible_dept": item.get("responsible_dept", "담당 부서"),
-                    "deadline": item.get("deadline", "미정"),
-                    "method": method_steps,
-                    "estimated_time": item.get("estimated_time", "미정"),
-                    "priority": reg['priority'],
-                    "status": "pending",
-                    "evidence": evidence_entries
-                })
-
-        except json.JSONDecodeError as e:
-            print(f"      ⚠️  JSON 파싱 오류: {e}")
+            checklists.extend(_parse_checklists(reg, reg_payload))
+        except MALFORMED_RESPONSE_ERRORS as e:
+            # 한 규제의 형식 오류가 묶음의 다른 규제 결과까지 버리지 않도록 규제 단위로 처리
+            logger.warning("      ⚠️  %s 체크리스트 파싱 오류: %s", reg['name'], e)
+    return checklists
+
+
+def _prepare(regulations: List[Regulation]) -> Tuple[Any, List[Sequence[Regulation]], List[List[BaseMessage]]]:
+    """JSON 모드 LLM과 규제 묶음, 묶음별 프롬프트를 준비합니다 (동기/비동기 경로 공용)."""
+    logger.info("📝 [Checklist Generator Agent] 규제별 체크리스트 생성 중...")
+
+    llm = get_llm(0.7).bind(
+        response_format={"type": "json_object"}
+    )
+
+    # 현재 시스템 시간 가져오기
+    current_date = datetime.now().strftime("%Y-%m-%d")
+
+    for reg in regulations:
+        logger.info("   %s - 체크리스트 생성 중...", reg['name'])
+
+    # 규제 묶음마다 한 번의 호출 (고정 지시문은 묶음당 1회), 묶음들은 하나의 배치로 동시 실행
+    chunks = chunked(regulations, REGULATIONS_PER_PROMPT)
+    return llm, chunks, [_build_prompt(chunk, current_date) for chunk in chunks]
+
+
+def _collect(chunks: List[Sequence[Regulation]], responses: List[Any]) -> Dict[str, Any]:
+    """묶음별 배치 응답(실패는 예외 객체)을 체크리스트 목록으로 모읍니다."""
+    all_checklists = []
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            logger.warning(
+                "      ⚠️  %s 체크리스트 생성 실패: %s",
+                ", ".join(reg['name'] for reg in chunk), response,
+            )
             continue
+        all_checklists.extend(_parse_chunk(chunk, response.content))
 
-    print(f"   ✓ 체크리스트 생성 완료: 총 {len(all_checklists)}개 항목\n")
+    logger.info("   ✓ 체크리스트 생성 완료: 총 %d개 항목", len(all_checklists))
 
     return {"checklists": all_checklists}
+
+
+async def _agenerate_checklists(regulations: List[Regulation]) -> Dict[str, Any]:
+    """_generate_checklists의 비동기 버전."""
+    llm, chunks, prompts = _prepare(regulations)
+    responses = await llm.abatch(
+        prompts,
+        config={"max_concurrency": llm_max_concurrency()},
+        return_exceptions=True,
+    )
+    return _collect(chunks, responses)
+
+
+def _generate_checklists(regulations: List[Regulation]) -> Dict[str, Any]:
+    """각 규제에 대한 실행 가능한 체크리스트를 생성합니다.
+
+    Args:
+        regulations: 우선순위가 결정된 규제 목록
+
+    Returns:
+        체크리스트 항목 목록
+    """
+    llm, chunks, prompts = _prepare(regulations)
+    responses = llm.batch(
+        prompts,
+        config={"max_concurrency": llm_max_concurrency()},
+        return_exceptions=True,
+    )
+    return _collect(chunks, responses)
+
+
+generate_checklists = StructuredTool.from_function(
+    func=_generate_checklists,
+    coroutine=_agenerate_checklists,
+    name="generate_checklists",
+)
@@ -2,39 +2,55 @@
 Classifier Agent - 규제 분류 및 적용성 판단
 """
 
-from typing import Dict, Any, List
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI
-import json
+import logging
+from collections import Counter
+from typing import Dict, Any, List, Literal
+from langchain_core.runnables import Runnable
+from langchain_core.tools import StructuredTool
+from pydantic import BaseModel
 
-from ..models import BusinessInfo
+from ..models import BusinessInfo, Category, Priority
+from ..utils import MALFORMED_RESPONSE_ERRORS, get_llm, parse_llm_json
 
+logger = logging.getLogger(__name__)
 
-@tool
-def classify_regulations(
-    business_info: BusinessInfo,
-    search_results: List[Dict[str, Any]]
-) -> Dict[str, Any]:
-    """검색 결과를 분석하여 적용 가능한 규제를 3개 카테고리로 분류합니다.
 
-    Args:
-        business_info: 사업 정보
-        search_results: 검색된 규제 정보
+# 구조화 출력 스키마 (OpenAI json_schema strict 모드로 서버에서 형식을 보장)
+# 허용 카테고리 (형식이 어긋난 캐시 응답의 category 값을 검증)
+_CATEGORIES = frozenset(category.value for category in Category)
+
+
+class _ClassifiedSource(BaseModel):
+    source_id: str
+    excerpt: str
 
-    Returns:
-        분류된 규제 목록
-    """
-    print("📋 [Classifier Agent] 규제 분류 및 적용성 판단 중...")
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
+class _ClassifiedRegulation(BaseModel):
+    name: str
+    category: Literal["안전/환경", "제품 인증", "공장 운영"]
+    why_applicable: str
+    authority: str
+    priority: Literal["HIGH", "MEDIUM", "LOW"]
+    key_requirements: List[str]
+    reference_url: str
+    sources: List[_ClassifiedSource]
 
-    # 검색 결과를 텍스트로 정리
+
+class _ClassificationResponse(BaseModel):
+    regulations: List[_ClassifiedRegulation]
+
+
+def _build_prompt(business_info: BusinessInfo, search_results: List[Dict[str, Any]]) -> str:
+    """검색 근거 기반 규제 분류 프롬프트를 만듭니다 (동기/비동기 경로 공용)."""
+    logger.info("📋 [Classifier Agent] 규제 분류 및 적용성 판단 중...")
+
+    # 검색 결과를 텍스트로 정리 (키워드 그룹별 결과가 번갈아 정렬되어 있어 상위 5개가 모든 그룹을 포함)
     search_summary = "\n\n".join([
-        f"{r.get('source_id', f'DOC-{i+1}')} | {r.get('title', '제목 없음')}\nURL: {r.get('url', '미기재')}\n요약: {r.get('content', '')[:300]}..."
+        f"{r.get('source_id', f'DOC-{i+1}')} | {r.get('title', '제목 없음')}\nURL: {r.get('url', '미기재')}\n요약: {r.get('content', '')}"
         for i, r in enumerate(search_results[:5])
     ])
 
-    prompt = f"""
+    return f"""
 다음 정보를 바탕으로 '검색 근거 기반' 규제 분류를 수행하세요.
 검색 요약은 [문서ID]로 표기되며, 반드시 해당 ID를 사용해 출처를 지정해야 합니다.
 
@@ -54,14 +70,20 @@ def classify_regulations(
 3) category는 '안전/환경' | '제품 인증' | '공장 운영' 중 하나입니다.
 4) key_requirements는 실행형 문장 2~4개.
 5) reference_url은 선택한 출처 중 가장 공식적인 URL을 사용합니다.
-6) 출력은 JSON 배열이며, 각 항목은 아래 스키마를 따릅니다.
-
-[
+6) priority는 HIGH | MEDIUM | LOW 중 하나입니다.
+   - HIGH: 법정 필수 요구사항, 위반 시 사업 중단/고액 벌금, 즉시 준수 필요
+   - MEDIUM: 중요하지만 일정 기간 유예 가능, 중간 수준 벌금
+   - LOW: 권장 사항, 선택적 준수, 낮은 벌금
+7) 출력은 {{"regulations": [...]}} 형태의 JSON 객체이며, 배열의 각 항목은 아래 스키마를 따릅니다.
+
+{{
+  "regulations": [
   {{
     "name": "규제명",
     "category": "안전/환경|제품 인증|공장 운영",
     "why_applicable": "이 사업에 적용되는 이유",
     "authority": "관할 기관",
+    "priority": "HIGH|MEDIUM|LOW",
     "key_requirements": ["요구사항1", "요구사항2"],
     "reference_url": "https://...",
     "sources": [
@@ -71,80 +93,152 @@ def classify_regulations(
       }}
     ]
   }}
-]
+  ]
+}}
 
 JSON 이외 텍스트를 출력하지 말고, sources 배열은 최대 3개까지 포함하세요.
 """
 
-    response = llm.invoke(prompt)
+
+def _structured_llm() -> Runnable:
+    """구조화 출력 LLM을 반환합니다 (응답이 항상 _ClassificationResponse 스키마를 따르는 JSON)."""
+    return get_llm(0).bind(
+        response_format=_ClassificationResponse
+    )
+
+
+def _parse_response(response: Any, search_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """분류 응답을 Regulation 목록으로 변환합니다."""
 
     source_lookup = {item.get("source_id"): item for item in search_results if item.get("source_id")}
+    # reference_url → 출처 역색인 (같은 URL이면 먼저 등장한 출처 사용)
+    source_by_url: Dict[str, Dict[str, Any]] = {}
+    for src in source_lookup.values():
+        url = src.get("url")
+        if url and url not in source_by_url:
+            source_by_url[url] = src
 
     try:
-        # JSON 파싱
-        content = response.content.strip()
-        # 마크다운 코드블록 제거
-        if content.startswith("```"):
-            content = content.split("```")[1]
-            if content.startswith("json"):
-                content = content[4:]
-
-        regulations_data = json.loads(content.strip())
+        parsed = response.additional_kwargs.get("parsed")
+        if isinstance(parsed, _ClassificationResponse):
+            # API가 스키마 검증까지 마친 객체를 바로 사용
+            regulations_data = [reg.model_dump() for reg in parsed.regulations]
+        else:
+            # 응답 캐시 적중 시에는 본문 텍스트만 있으므로 JSON 파싱
+            regulations_data = parse_llm_json(response.content)
+            if isinstance(regulations_data, dict):
+                regulations_data = regulations_data.get("regulations", [])
+            # 형식이 어긋난 응답이 .get() 호출에서 도구 전체를 중단시키지 않도록 dict 항목만 사용
+            if not isinstance(regulations_data, list):
+                regulations_data = []
+            regulations_data = [reg for reg in regulations_data if isinstance(reg, dict)]
 
         # Regulation 형식으로 변환
         regulations = []
         for idx, reg in enumerate(regulations_data, 1):
             source_entries = []
             for src in reg.get("sources", []) or []:
+                if not isinstance(src, dict):
+                    continue
                 src_id = src.get("source_id")
                 matched = source_lookup.get(src_id, {})
+                # 캐시된 응답은 스키마 검증을 거치지 않으므로 null/비문자열 발췌는 검색 본문으로 대체
+                excerpt = src.get("excerpt")
+                if not isinstance(excerpt, str):
+                    excerpt = matched.get("content", "") or ""
                 source_entries.append({
                     "source_id": src_id or f"SRC-{idx:03d}",
                     "title": matched.get("title", ""),
                     "url": matched.get("url", ""),
-                    "snippet": src.get("excerpt", matched.get("content", ""))[:300]
+                    "snippet": excerpt[:300]
                 })
 
             primary_url = reg.get("reference_url") or (source_entries[0]["url"] if source_entries else "")
 
             if not source_entries and primary_url:
-                matched = next(
-                    (src for src in source_lookup.values() if src.get("url") == primary_url),
-                    {}
-                )
+                matched = source_by_url.get(primary_url, {})
                 source_entries.append({
                     "source_id": matched.get("source_id", f"SRC-{idx:03d}"),
                     "title": matched.get("title", ""),
                     "url": primary_url,
-                    "snippet": matched.get("content", "")[:300]
+                    "snippet": matched.get("content", "")
                 })
 
+            # 분류와 함께 받은 우선순위 (Prioritizer가 규칙으로 판단하기 애매할 때 사용)
+            try:
+                priority = Priority(str(reg.get("priority") or "").strip().upper()).value
+            except ValueError:
+                priority = Priority.MEDIUM.value
+
+            category = reg.get("category")
+            if not isinstance(category, str) or category not in _CATEGORIES:
+                category = Category.SAFETY_ENV.value
+
+            key_requirements = reg.get("key_requirements") or []
+            if isinstance(key_requirements, str):
+                key_requirements = [key_requirements]
+            elif isinstance(key_requirements, list):
+                key_requirements = [str(req) for req in key_requirements if req]
+            else:
+                key_requirements = []
+
             regulations.append({
                 "id": f"REG-{idx:03d}",
                 "name": reg.get("name", "미지정"),
-                "category": reg.get("category", "안전/환경"),
+                "category": category,
                 "why_applicable": reg.get("why_applicable", ""),
                 "authority": reg.get("authority", "미지정"),
-                "priority": "MEDIUM",  # 기본값, Prioritizer에서 결정
-                "key_requirements": reg.get("key_requirements", []),
+                "priority": priority,  # 최종 값은 Prioritizer에서 결정
+                "key_requirements": key_requirements,
                 "reference_url": primary_url,
                 "sources": source_entries
             })
 
         # 카테고리별 개수 계산
-        category_count = {}
-        for reg in regulations:
-            cat = reg['category']
-            category_count[cat] = category_count.get(cat, 0) + 1
+        category_count = Counter(reg['category'] for reg in regulations)
 
-        print(f"   ✓ 규제 분류 완료: 총 {len(regulations)}개")
+        logger.info("   ✓ 규제 분류 완료: 총 %d개", len(regulations))
         for cat, count in category_count.items():
-            print(f"      - {cat}: {count}개")
-        print()
+            logger.info("      - %s: %d개", cat, count)
 
         return {"regulations": regulations}
 
-    except json.JSONDecodeError as e:
-        print(f"   ⚠️  JSON 파싱 오류: {e}")
-        print(f"   응답 내용: {response.content[:200]}...")
+    except MALFORMED_RESPONSE_ERRORS as e:
+        logger.warning("   ⚠️  응답 파싱 오류: %s", e)
+        logger.warning("   응답 내용: %s...", response.content[:200])
         return {"regulations": []}
+
+
+async def _aclassify_regulations(
+    business_info: BusinessInfo,
+    search_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """_classify_regulations의 비동기 버전."""
+    prompt = _build_prompt(business_info, search_results)
+    response = await _structured_llm().ainvoke(prompt)
+    return _parse_response(response, search_results)
+
+
+def _classify_regulations(
+    business_info: BusinessInfo,
+    search_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """검색 결과를 분석하여 적용 가능한 규제를 3개 카테고리로 분류합니다.
+
+    Args:
+        business_info: 사업 정보
+        search_results: 검색된 규제 정보
+
+    Returns:
+        분류된 규제 목록
+    """
+    prompt = _build_prompt(business_info, search_results)
+    response = _structured_llm().invoke(prompt)
+    return _parse_response(response, search_results)
+
+
+classify_regulations = StructuredTool.from_function(
+    func=_classify_regulations,
+    coroutine=_aclassify_regulations,
+    name="classify_regulations",
+)
@@ -2,45 +2,56 @@
 Email Notification Agent
 """
 
-from typing import List, Dict, Any, Optional
+import logging
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from dotenv import load_dotenv
-from langchain.tools import tool
-from markdown import markdown
+from langchain_core.tools import StructuredTool
+from markdown_it import MarkdownIt
 
 from ..models import BusinessInfo, FinalReport, ChecklistItem, ExecutionPlan
 from ..email_utils import (
+    AsyncEmailSender,
     EmailSender,
     prepare_email_recipient,
     create_email_body,
     extract_executive_summary,
 )
 
+logger = logging.getLogger(__name__)
 
-@tool
-def send_final_report_email(
+# 경영진 요약 렌더러 (모듈 로드 시 1회 생성 후 재사용)
+_MD = MarkdownIt("commonmark")
+
+# 수신자가 이 수 이상이면 1/3 이상 실패 시 남은 발송을 중단
+_BATCH_ABORT_MIN_SIZE = 30
+_ABORT_ERROR = "발송 실패가 누적되어 남은 이메일 전송을 중단했습니다."
+
+
+def _normalize_candidates(values: Optional[List[str]]) -> List[str]:
+    normalized: List[str] = []
+    if not values:
+        return normalized
+    for entry in values:
+        if entry is None:
+            continue
+        for token in str(entry).split(","):
+            email = token.strip()
+            if email and email not in normalized:
+                normalized.append(email)
+    return normalized
+
+
+def _prepare_delivery(
     final_report: FinalReport,
     business_info: BusinessInfo,
     checklists: List[ChecklistItem],
     execution_plans: List[ExecutionPlan],
-    recipient_emails: Optional[List[str]] = None,
-) -> Dict[str, Any]:
-    """최종 보고서를 이메일로 전송합니다."""
+    recipient_emails: Optional[List[str]],
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+    """수신자/본문/첨부를 준비합니다. 보낼 대상이 없으면 job은 None입니다."""
     load_dotenv()
 
-    def normalize_candidates(values: Optional[List[str]]) -> List[str]:
-        normalized: List[str] = []
-        if not values:
-            return normalized
-        for entry in values:
-            if entry is None:
-                continue
-            for token in str(entry).split(","):
-                email = token.strip()
-                if email and email not in normalized:
-                    normalized.append(email)
-        return normalized
-
     provided = recipient_emails or []
     if not provided:
         fallback = business_info.get("contact_email")
@@ -49,7 +60,7 @@ def send_final_report_email(
         elif isinstance(fallback, str):
             provided = [fallback]
 
-    candidate_emails = normalize_candidates(provided)
+    candidate_emails = _normalize_candidates(provided)
     status_payload = {
         "recipients": candidate_emails,
         "details": [],
@@ -61,7 +72,7 @@ def send_final_report_email(
 
     if not candidate_emails:
         status_payload["errors"] = ["수신자 이메일이 지정되지 않았습니다."]
-        return {"email_status": status_payload}
+        return status_payload, None
 
     pdf_path = Path(final_report.get("report_pdf_path", ""))
     pdf_exists = pdf_path.exists()
@@ -70,7 +81,7 @@ def send_final_report_email(
     summary_md = final_report.get("executive_summary", "") or extract_executive_summary(
         final_report.get("full_markdown", "")
     )
-    summary_html = markdown(summary_md) if summary_md else "<p>요약 정보가 없습니다.</p>"
+    summary_html = _MD.render(summary_md) if summary_md else "<p>요약 정보가 없습니다.</p>"
 
     body = create_email_body(
         summary=summary_html,
@@ -87,49 +98,45 @@ def send_final_report_email(
         next_steps=final_report.get("next_steps", []),
     )
 
-    sender = EmailSender()
     if pdf_exists:
         status_payload["attachments"] = [pdf_filename]
+    else:
+        logger.warning("⚠️  PDF 보고서를 찾을 수 없어 첨부 없이 전송합니다.")
+
+    job = {
+        "candidates": candidate_emails,
+        "subject": f"[RegTech Assistant] {business_info.get('industry', '규제')} 분석 보고서",
+        "body": body,
+        "pdf_path": pdf_path if pdf_exists else None,
+    }
+    return status_payload, job
 
-    results: List[Dict[str, Any]] = []
-    overall_success = True
-
-    for candidate in candidate_emails:
-        normalized_email, validation_error = prepare_email_recipient(candidate)
-        detail: Dict[str, Any] = {
-            "input": candidate,
-            "recipient": normalized_email or candidate,
-            "success": False,
-        }
-
-        if validation_error:
-            detail["error"] = validation_error
-            overall_success = False
-            results.append(detail)
-            continue
 
-        results.append(detail)
+def _new_detail(candidate: str) -> Dict[str, Any]:
+    """수신자 검증 결과를 담은 detail 항목을 만듭니다 (오류 시 'error' 포함)."""
+    normalized_email, validation_error = prepare_email_recipient(candidate)
+    detail: Dict[str, Any] = {
+        "input": candidate,
+        "recipient": normalized_email or candidate,
+        "success": False,
+    }
+    if validation_error:
+        detail["error"] = validation_error
+    return detail
+
 
-    if not pdf_exists:
-        print("⚠️  PDF 보고서를 찾을 수 없어 첨부 없이 전송합니다.")
+def _should_abort(failed: int, total: int) -> bool:
+    """수신자가 많은 발송에서 1/3 이상 실패하면 남은 발송을 중단합니다."""
+    return total >= _BATCH_ABORT_MIN_SIZE and failed * 3 >= total
 
-    subject = f"[RegTech Assistant] {business_info.get('industry', '규제')} 분석 보고서"
 
-    for detail in results:
-        if detail.get("error"):
-            continue
+def _record_send(detail: Dict[str, Any], success: bool, last_error: Optional[str]) -> None:
+    detail["success"] = success
+    if not success:
+        detail["error"] = last_error or "SMTP 전송에 실패했습니다. Gmail 설정을 확인하세요."
 
-        success = sender.send_report(
-            recipient_email=detail["recipient"],
-            subject=subject,
-            body=body,
-            pdf_path=pdf_path if pdf_exists else None,
-        )
-        detail["success"] = success
-        if not success:
-            detail["error"] = sender.last_error or "SMTP 전송에 실패했습니다. Gmail 설정을 확인하세요."
-            overall_success = False
 
+def _finalize_status(status_payload: Dict[str, Any], results: List[Dict[str, Any]]) -> Dict[str, Any]:
     status_payload["details"] = results
     status_payload["recipients"] = [
         detail["recipient"] for detail in results if detail.get("recipient")
@@ -138,6 +145,99 @@ def send_final_report_email(
     if status_payload["errors"]:
         status_payload["errors"] = list(dict.fromkeys(status_payload["errors"]))
     status_payload["attempted"] = bool(results)
-    status_payload["success"] = overall_success and bool(results)
-
+    status_payload["success"] = bool(results) and all(detail["success"] for detail in results)
     return {"email_status": status_payload}
+
+
+def _send_final_report_email(
+    final_report: FinalReport,
+    business_info: BusinessInfo,
+    checklists: List[ChecklistItem],
+    execution_plans: List[ExecutionPlan],
+    recipient_emails: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """최종 보고서를 이메일로 전송합니다."""
+    status_payload, job = _prepare_delivery(
+        final_report, business_info, checklists, execution_plans, recipient_emails
+    )
+    if job is None:
+        return {"email_status": status_payload}
+
+    sender = EmailSender()
+    results: List[Dict[str, Any]] = []
+    failed = 0
+
+    try:
+        # 수신자마다 검증 후 바로 공유 연결로 발송 (한 번의 순회)
+        for candidate in job["candidates"]:
+            detail = _new_detail(candidate)
+            results.append(detail)
+            if detail.get("error"):
+                continue
+            if _should_abort(failed, len(job["candidates"])):
+                detail["error"] = _ABORT_ERROR
+                continue
+
+            success = sender.send_report(
+                recipient_email=detail["recipient"],
+                subject=job["subject"],
+                body=job["body"],
+                pdf_path=job["pdf_path"],
+            )
+            _record_send(detail, success, sender.last_error)
+            failed += not success
+    finally:
+        sender.close()
+
+    return _finalize_status(status_payload, results)
+
+
+async def _asend_final_report_email(
+    final_report: FinalReport,
+    business_info: BusinessInfo,
+    checklists: List[ChecklistItem],
+    execution_plans: List[ExecutionPlan],
+    recipient_emails: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """_send_final_report_email의 비동기 버전: aiosmtplib으로 발송."""
+    status_payload, job = _prepare_delivery(
+        final_report, business_info, checklists, execution_plans, recipient_emails
+    )
+    if job is None:
+        return {"email_status": status_payload}
+
+    # 발송자는 호출마다 새로 만들어 닫으므로 연결/STARTTLS/LOGIN은 호출당 1회이며,
+    # 같은 보고서의 여러 수신자끼리만 연결을 재사용 (aiosmtplib 클라이언트는 이벤트 루프에 묶임)
+    sender = AsyncEmailSender()
+    results: List[Dict[str, Any]] = []
+    failed = 0
+
+    try:
+        for candidate in job["candidates"]:
+            detail = _new_detail(candidate)
+            results.append(detail)
+            if detail.get("error"):
+                continue
+            if _should_abort(failed, len(job["candidates"])):
+                detail["error"] = _ABORT_ERROR
+                continue
+
+            success = await sender.send_report(
+                recipient_email=detail["recipient"],
+                subject=job["subject"],
+                body=job["body"],
+                pdf_path=job["pdf_path"],
+            )
+            _record_send(detail, success, sender.last_error)
+            failed += not success
+    finally:
+        await sender.close()
+
+    return _finalize_status(status_payload, results)
+
+
+send_final_report_email = StructuredTool.from_function(
+    func=_send_final_report_email,
+    coroutine=_asend_final_report_email,
+    name="send_final_report_email",
+)
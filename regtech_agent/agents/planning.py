@@ -2,79 +2,32 @@
 Planning Agent - 실행 계획 수립
 """
 
-from typing import Dict, Any, List
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI
-import json
+import logging
+from collections import defaultdict
+from typing import Dict, Any, List, Tuple
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.tools import StructuredTool
 
 from ..models import Regulation, ChecklistItem, ExecutionPlan, Milestone
 from ..utils import (
+    MALFORMED_RESPONSE_ERRORS,
     normalize_evidence_payload,
     normalize_milestones,
     normalize_dependencies,
     normalize_parallel_tasks,
     normalize_task_ids,
     ensure_dict_list,
-    merge_evidence
+    merge_evidence,
+    parse_llm_json,
+    get_llm,
+    llm_max_concurrency
 )
 
+logger = logging.getLogger(__name__)
 
-@tool
-def plan_execution(
-    regulations: List[Regulation],
-    checklists: List[ChecklistItem]
-) -> Dict[str, Any]:
-    """체크리스트를 실행 가능한 계획으로 변환합니다.
-
-    Args:
-        regulations: 규제 목록
-        checklists: 체크리스트 목록
-
-    Returns:
-        실행 계획 목록
-    """
-    print("📅 [Planning Agent] 실행 계획 수립 중...")
-
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-
-    # 규제별로 체크리스트 그룹핑
-    checklists_by_regulation = {}
-    for item in checklists:
-        reg_id = item['regulation_id']
-        if reg_id not in checklists_by_regulation:
-            checklists_by_regulation[reg_id] = []
-        checklists_by_regulation[reg_id].append(item)
-
-    all_execution_plans = []
-
-    for reg in regulations:
-        reg_id = reg['id']
-        reg_name = reg['name']
-        reg_priority = reg['priority']
-
-        # 해당 규제의 체크리스트 항목들
-        reg_checklists = checklists_by_regulation.get(reg_id, [])
-
-        if not reg_checklists:
-            continue
-
-        task_ids = [str(i + 1) for i in range(len(reg_checklists))]
-
-        # 체크리스트 요약
-        checklist_summary = "\n".join([
-            f"{i+1}. {item['task_name']}\n   담당: {item['responsible_dept']}\n   마감: {item['deadline']}\n   기간: {item['estimated_time']}"
-            for i, item in enumerate(reg_checklists)
-        ])
-
-        prompt = f"""
-다음 규제의 체크리스트를 바탕으로 실행 계획을 수립하세요.
-
-[규제 정보]
-규제명: {reg_name}
-우선순위: {reg_priority}
-
-[체크리스트 항목들]
-{checklist_summary}
+# 고정 지시문/출력 스키마 (모든 규제·실행에서 동일한 system 메시지 → OpenAI 프롬프트 접두사 캐시 대상)
+_SYSTEM_MESSAGE = SystemMessage(content="""
+사용자가 제공하는 규제의 체크리스트를 바탕으로 실행 계획을 수립하세요.
 
 다음 정보를 분석하여 JSON 형식으로 제공하세요:
 1. 전체 예상 소요 기간 (timeline)
@@ -85,27 +38,27 @@ def plan_execution(
 6. 크리티컬 패스 (critical_path: 가장 오래 걸리는 경로의 작업 번호들)
 
 출력 형식:
-{{
+{
     "timeline": "3개월",
     "start_date": "즉시",
     "milestones": [
-        {{
+        {
             "name": "1개월 차: 서류 준비 완료",
             "deadline": "30일 내",
             "tasks": ["1", "2"],
             "completion_criteria": "필요 서류 모두 준비"
-        }}
+        }
     ],
-    "dependencies": {{
+    "dependencies": {
         "2": ["1"],
         "3": ["1", "2"]
-    }},
+    },
     "parallel_tasks": [
         ["1", "2"],
         ["3", "4"]
     ],
     "critical_path": ["1", "2", "5"]
-}}
+}
 
 참고:
 - 우선순위 HIGH는 즉시 시작
@@ -115,26 +68,109 @@ def plan_execution(
 - parallel_tasks는 동시에 진행 가능한 작업 그룹들의 리스트
 
 출력은 JSON 형식으로만 작성하세요.
-"""
+""")
+
+
+def _default_plan(
+    plan_no: int,
+    reg: Regulation,
+    task_ids: List[str],
+    plan_evidence: List[Dict[str, Any]]
+) -> ExecutionPlan:
+    """LLM 응답을 사용할 수 없을 때의 기본 실행 계획입니다."""
+    return {
+        "plan_id": f"PLAN-{plan_no:03d}",
+        "regulation_id": reg['id'],
+        "regulation_name": reg['name'],
+        "checklist_items": task_ids,
+        "timeline": "3개월",
+        "start_date": "즉시" if reg['priority'] == "HIGH" else "1개월 내",
+        "milestones": [],
+        "dependencies": {},
+        "parallel_tasks": [],
+        "critical_path": task_ids,
+        "evidence": plan_evidence
+    }
+
+
+def _prepare(
+    regulations: List[Regulation],
+    checklists: List[ChecklistItem]
+) -> Tuple[Any, List[Tuple[Regulation, List[ChecklistItem]]], List[List[BaseMessage]]]:
+    """JSON 모드 LLM과 체크리스트가 있는 규제 목록, 규제별 프롬프트를 준비합니다 (동기/비동기 경로 공용)."""
+    logger.info("📅 [Planning Agent] 실행 계획 수립 중...")
+
+    llm = get_llm(0).bind(
+        response_format={"type": "json_object"}
+    )
+
+    # 규제별로 체크리스트 그룹핑 (한 번의 순회, 항목당 1회 조회)
+    checklists_by_regulation: Dict[str, List[ChecklistItem]] = defaultdict(list)
+    for item in checklists:
+        checklists_by_regulation[item['regulation_id']].append(item)
+
+    # 체크리스트가 있는 규제만 프롬프트를 만들어 하나의 배치로 동시 실행
+    pending = []
+    prompts = []
+    for reg in regulations:
+        # 해당 규제의 체크리스트 항목들
+        reg_checklists = checklists_by_regulation.get(reg['id'], [])
+
+        if not reg_checklists:
+            continue
 
-        response = llm.invoke(prompt)
+        # 체크리스트 요약
+        checklist_summary = "\n".join([
+            f"{i+1}. {item['task_name']}\n   담당: {item['responsible_dept']}\n   마감: {item['deadline']}\n   기간: {item['estimated_time']}"
+            for i, item in enumerate(reg_checklists)
+        ])
+
+        pending.append((reg, reg_checklists))
+        prompts.append([
+            _SYSTEM_MESSAGE,
+            HumanMessage(content=f"""
+[규제 정보]
+규제명: {reg['name']}
+우선순위: {reg['priority']}
+
+[체크리스트 항목들]
+{checklist_summary}
+"""),
+        ])
+
+    return llm, pending, prompts
+
+
+def _collect(
+    pending: List[Tuple[Regulation, List[ChecklistItem]]],
+    responses: List[Any]
+) -> Dict[str, Any]:
+    """규제별 배치 응답(실패는 예외 객체)을 실행 계획 목록으로 변환합니다."""
+    all_execution_plans = []
+
+    for (reg, reg_checklists), response in zip(pending, responses):
+        reg_id = reg['id']
+        reg_name = reg['name']
+        reg_priority = reg['priority']
+
+        task_ids = [str(i + 1) for i in range(len(reg_checklists))]
+        plan_evidence = merge_evidence([item.get("evidence", []) for item in reg_checklists])
+
+        if isinstance(response, Exception):
+            logger.warning("      ⚠️  %s 실행 계획 수립 실패: %s", reg_name, response)
+            all_execution_plans.append(
+                _default_plan(len(all_execution_plans) + 1, reg, task_ids, plan_evidence)
+            )
+            continue
 
         try:
             # JSON 파싱
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-
-            plan_data = json.loads(content.strip())
+            plan_data = parse_llm_json(response.content)
             if isinstance(plan_data, list):
                 plan_data = plan_data[0] if plan_data else {}
             if not isinstance(plan_data, dict):
                 plan_data = {}
 
-            plan_evidence = merge_evidence([item.get("evidence", []) for item in reg_checklists])
-
             milestones = normalize_milestones(
                 plan_data.get("milestones"),
                 task_ids
@@ -178,26 +214,56 @@ def plan_execution(
 
             all_execution_plans.append(execution_plan)
 
-        except json.JSONDecodeError as e:
-            print(f"      ⚠️  JSON 파싱 오류: {e}")
+        except MALFORMED_RESPONSE_ERRORS as e:
+            logger.warning("      ⚠️  응답 파싱 오류: %s", e)
             # 기본 실행 계획 생성
-            plan_evidence = merge_evidence([item.get("evidence", []) for item in reg_checklists])
+            all_execution_plans.append(
+                _default_plan(len(all_execution_plans) + 1, reg, task_ids, plan_evidence)
+            )
 
-            default_plan: ExecutionPlan = {
-                "plan_id": f"PLAN-{len(all_execution_plans) + 1:03d}",
-                "regulation_id": reg_id,
-                "regulation_name": reg_name,
-                "checklist_items": task_ids,
-                "timeline": "3개월",
-                "start_date": "즉시" if reg_priority == "HIGH" else "1개월 내",
-                "milestones": [],
-                "dependencies": {},
-                "parallel_tasks": [],
-                "critical_path": task_ids,
-                "evidence": plan_evidence
-            }
-            all_execution_plans.append(default_plan)
+    logger.info("   ✓ 실행 계획 수립 완료: 총 %d개 계획", len(all_execution_plans))
+
+    return {"execution_plans": all_execution_plans}
+
+
+async def _aplan_execution(
+    regulations: List[Regulation],
+    checklists: List[ChecklistItem]
+) -> Dict[str, Any]:
+    """_plan_execution의 비동기 버전."""
+    llm, pending, prompts = _prepare(regulations, checklists)
+    responses = await llm.abatch(
+        prompts,
+        config={"max_concurrency": llm_max_concurrency()},
+        return_exceptions=True,
+    )
+    return _collect(pending, responses)
 
-    print(f"   ✓ 실행 계획 수립 완료: 총 {len(all_execution_plans)}개 계획\n")
 
-    return {"execution_plans": all_execution_plans}
\ No newline at end of file
+def _plan_execution(
+    regulations: List[Regulation],
+    checklists: List[ChecklistItem]
+) -> Dict[str, Any]:
+    """체크리스트를 실행 가능한 계획으로 변환합니다.
+
+    Args:
+        regulations: 규제 목록
+        checklists: 체크리스트 목록
+
+    Returns:
+        실행 계획 목록
+    """
+    llm, pending, prompts = _prepare(regulations, checklists)
+    responses = llm.batch(
+        prompts,
+        config={"max_concurrency": llm_max_concurrency()},
+        return_exceptions=True,
+    )
+    return _collect(pending, responses)
+
+
+plan_execution = StructuredTool.from_function(
+    func=_plan_execution,
+    coroutine=_aplan_execution,
+    name="plan_execution",
+)
@@ -2,15 +2,52 @@
 Prioritizer Agent - 규제 우선순위 결정
 """
 
+import logging
+import re
+from collections import Counter
 from typing import Dict, Any, List
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI
+from langchain_core.tools import StructuredTool
 
-from ..models import BusinessInfo, Regulation
+from ..models import BusinessInfo, Priority, Regulation
 
+logger = logging.getLogger(__name__)
 
-@tool
-def prioritize_regulations(
+# 규칙 기반 점수 기준 (점수 >= HIGH_THRESHOLD → HIGH, >= MEDIUM_THRESHOLD → MEDIUM)
+HIGH_THRESHOLD = 5
+MEDIUM_THRESHOLD = 3
+# 규칙만으로 판단하기 애매한 점수 → Classifier가 제안한 우선순위로 결정
+AMBIGUOUS_SCORE = 4
+
+_HIGH_WEIGHT_AUTHORITIES = ("환경부", "고용노동부")
+_MANDATORY_RE = re.compile(r"(필수|의무|처벌|벌금|영업정지)")
+_VALID_PRIORITIES = frozenset(p.value for p in Priority)
+
+
+def _score_priority(reg: Regulation, employee_count: int) -> int:
+    """관할 기관/카테고리/의무 표현/사업장 규모로 규제의 우선순위 점수를 계산합니다."""
+    score = 0
+    authority = reg.get("authority") or ""
+    if any(name in authority for name in _HIGH_WEIGHT_AUTHORITIES):
+        score += 3
+    if reg.get("category") == "안전/환경":
+        score += 2
+    text = " ".join([reg.get("why_applicable") or "", *(reg.get("key_requirements") or [])])
+    if _MANDATORY_RE.search(text):
+        score += 2
+    if employee_count >= 50:
+        score += 1
+    return score
+
+
+def _priority_from_score(score: int) -> str:
+    if score >= HIGH_THRESHOLD:
+        return "HIGH"
+    if score >= MEDIUM_THRESHOLD:
+        return "MEDIUM"
+    return "LOW"
+
+
+def _prioritize_regulations(
     business_info: BusinessInfo,
     regulations: List[Regulation]
 ) -> Dict[str, Any]:
@@ -23,64 +60,50 @@ def prioritize_regulations(
     Returns:
         우선순위가 지정된 규제 목록
     """
-    print("⚡ [Prioritizer Agent] 우선순위 결정 중...")
-
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0)
-
-    # 규제 목록을 텍스트로 정리
-    regulations_summary = "\n".join([
-        f"{i+1}. {r['name']} ({r['category']})\n   이유: {r['why_applicable']}\n   요구사항: {', '.join(r['key_requirements'][:2])}"
-        for i, r in enumerate(regulations)
-    ])
-
-    prompt = f"""
-다음 규제들의 우선순위를 HIGH, MEDIUM, LOW로 결정하세요.
+    logger.info("⚡ [Prioritizer Agent] 우선순위 결정 중...")
+
+    try:
+        employee_count = int(business_info.get('employee_count', 0) or 0)
+    except (TypeError, ValueError):
+        employee_count = 0
+
+    # 규칙 기반 점수로 우선순위 결정
+    # 애매한 항목은 Classifier가 분류와 함께 제안한 우선순위를 사용 (별도 LLM 호출 없음)
+    priorities = []
+    for reg in regulations:
+        score = _score_priority(reg, employee_count)
+        if score == AMBIGUOUS_SCORE and reg.get('priority') in _VALID_PRIORITIES:
+            priorities.append(reg['priority'])
+        else:
+            priorities.append(_priority_from_score(score))
 
-[사업 정보]
-제품: {business_info['product_name']}
-직원 수: {business_info.get('employee_count', 0)}명
+    # 입력 규제(그래프 상태/캐시와 공유)는 건드리지 않고, 우선순위를 채운 새 dict를 한 번에 생성
+    prioritized_regulations = [
+        {**reg, 'priority': priority}
+        for reg, priority in zip(regulations, priorities)
+    ]
 
-[규제 목록]
-{regulations_summary}
+    # 우선순위별 개수 계산
+    priority_count = Counter(reg['priority'] for reg in prioritized_regulations)
 
-우선순위 기준:
-- HIGH: 법정 필수 요구사항, 위반 시 사업 중단/고액 벌금, 즉시 준수 필요
-- MEDIUM: 중요하지만 일정 기간 유예 가능, 중간 수준 벌금
-- LOW: 권장 사항, 선택적 준수, 낮은 벌금
+    logger.info(
+        "   ✓ 우선순위 결정 완료: HIGH %d개, MEDIUM %d개, LOW %d개",
+        priority_count['HIGH'], priority_count['MEDIUM'], priority_count['LOW'],
+    )
 
-출력 형식: 각 규제의 우선순위만 줄바꿈으로 구분하여 나열하세요.
-예시:
-HIGH
-MEDIUM
-HIGH
-LOW
-"""
+    return {"regulations": prioritized_regulations}
 
-    response = llm.invoke(prompt)
-    priorities = [p.strip() for p in response.content.strip().split('\n') if p.strip()]
-
-    # 우선순위 할당
-    prioritized_regulations = []
-    for idx, reg in enumerate(regulations):
-        updated_reg = reg.copy()
-        if idx < len(priorities):
-            priority = priorities[idx]
-            if priority in ["HIGH", "MEDIUM", "LOW"]:
-                updated_reg['priority'] = priority
-            else:
-                updated_reg['priority'] = "MEDIUM"
-        else:
-            updated_reg['priority'] = "MEDIUM"
-        prioritized_regulations.append(updated_reg)
 
-    # 우선순위별 개수 계산
-    priority_count = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-    for reg in prioritized_regulations:
-        priority_count[reg['priority']] += 1
+async def _aprioritize_regulations(
+    business_info: BusinessInfo,
+    regulations: List[Regulation]
+) -> Dict[str, Any]:
+    """_prioritize_regulations의 비동기 버전 (LLM 호출이 없어 동기 함수를 그대로 사용)."""
+    return _prioritize_regulations(business_info, regulations)
 
-    print(f"   ✓ 우선순위 결정 완료:")
-    print(f"      - HIGH: {priority_count['HIGH']}개")
-    print(f"      - MEDIUM: {priority_count['MEDIUM']}개")
-    print(f"      - LOW: {priority_count['LOW']}개\n")
 
-    return {"regulations": prioritized_regulations}
+prioritize_regulations = StructuredTool.from_function(
+    func=_prioritize_regulations,
+    coroutine=_aprioritize_regulations,
+    name="prioritize_regulations",
+)
@@ -2,11 +2,13 @@
 Report Generation Agent - 최종 통합 보고서 생성
 """
 
-from typing import Dict, Any, List
+import asyncio
+import logging
+from collections import Counter
+from typing import Dict, Any, Iterable, List, Tuple
 from pathlib import Path
 from datetime import datetime
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI
+from langchain_core.tools import StructuredTool
 
 from ..models import (
     BusinessInfo,
@@ -16,45 +18,40 @@ from ..models import (
     RiskAssessment,
     FinalReport
 )
-from ..utils import merge_evidence, save_report_pdf, format_evidence_link
+from ..utils import LIGHT_LLM_MODEL, get_llm, merge_evidence, save_report_pdf, format_evidence_link
 
+logger = logging.getLogger(__name__)
 
-@tool
-def generate_final_report(
-    business_info: BusinessInfo,
-    regulations: List[Regulation],
-    checklists: List[ChecklistItem],
-    execution_plans: List[ExecutionPlan],
-    risk_assessment: RiskAssessment
-) -> Dict[str, Any]:
-    """전체 분석 결과를 통합 마크다운 보고서로 작성하고 PDF로 저장합니다.
+# 우선순위 아이콘 (보고서 전체에서 공유)
+_PRIORITY_ICON = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "🟢"}
 
-    Args:
-        business_info: 사업 정보
-        regulations: 규제 목록
-        checklists: 체크리스트
-        execution_plans: 실행 계획
-        risk_assessment: 리스크 평가
+# 3장 규제 항목 헤더 템플릿
+_REG_HEADER_TMPL = (
+    "#### 3.{sec}.{j} {icon} {name}\n\n"
+    "**우선순위:** {prio}\n"
+    "**관할 기관:** {auth}\n"
+    "**적용 이유:** {why}\n\n"
+    "**주요 요구사항:**\n\n"
+).format
 
-    Returns:
-        최종 보고서 (통합 마크다운 + PDF 경로)
-    """
-    print("📄 [Report Generation Agent] 통합 보고서 생성 중...")
 
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
+def _bullet_block(lines: Iterable[str], sep: str = "\n\n") -> str:
+    """목록 항목 사이에 빈 줄을 넣고 마지막 항목 뒤에는 줄바꿈 하나만 붙입니다."""
+    return sep.join(lines) + "\n"
 
-    # === 1. 기본 통계 계산 ===
-    priority_count = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
-    category_count = {}
-    for reg in regulations:
-        priority_count[reg['priority']] += 1
-        cat = reg['category']
-        category_count[cat] = category_count.get(cat, 0) + 1
 
-    high_risk_items = risk_assessment.get('high_risk_items', [])
-    total_risk_score = risk_assessment.get('total_risk_score', 0)
-    immediate_actions = [reg for reg in regulations if reg['priority'] == 'HIGH']
+def _evidence_block(evidence: List[Dict[str, Any]], sep: str = "\n\n") -> str:
+    """근거 출처 목록을 들여쓴 링크 목록으로 만듭니다."""
+    return _bullet_block((f"  - {format_evidence_link(ev)}" for ev in evidence), sep)
+
 
+def _report_stats(
+    regulations: List[Regulation],
+    checklists: List[ChecklistItem],
+    execution_plans: List[ExecutionPlan],
+    risk_assessment: RiskAssessment
+) -> Dict[str, Any]:
+    """보고서 전체에서 사용하는 기본 통계와 근거 출처를 계산합니다."""
     regulation_evidence = merge_evidence([reg.get('sources', []) for reg in regulations])
     checklist_evidence = merge_evidence([item.get('evidence', []) for item in checklists])
     execution_plan_evidence = merge_evidence([plan.get('evidence', []) for plan in execution_plans])
@@ -62,18 +59,78 @@ def generate_final_report(
         item.get('evidence', []) for bucket in risk_assessment.get('risk_matrix', {}).values()
         for item in bucket
     ] if isinstance(risk_assessment.get('risk_matrix'), dict) else [])
-    all_citations = merge_evidence([
-        regulation_evidence,
-        checklist_evidence,
-        execution_plan_evidence,
-        risk_evidence
-    ])
 
-    # === 2. 통합 마크다운 보고서 생성 ===
-    print("   통합 마크다운 보고서 작성 중...")
+    return {
+        "priority_count": Counter(reg['priority'] for reg in regulations),
+        "category_count": Counter(reg['category'] for reg in regulations),
+        "high_risk_items": risk_assessment.get('high_risk_items', []),
+        "total_risk_score": risk_assessment.get('total_risk_score', 0),
+        "immediate_actions": [reg for reg in regulations if reg['priority'] == 'HIGH'],
+        "all_citations": merge_evidence([
+            regulation_evidence,
+            checklist_evidence,
+            execution_plan_evidence,
+            risk_evidence
+        ]),
+    }
+
+
+def _exec_summary_prompt(regulations: List[Regulation], stats: Dict[str, Any]) -> str:
+    """경영진 요약 프롬프트 (통계만 사용하므로 본문 작성 전에 보낼 수 있음)."""
+    priority_count = stats["priority_count"]
+    return f"""
+다음 규제 분석 결과를 바탕으로 경영진을 위한 핵심 요약을 작성하세요.
+
+[분석 결과]
+- 총 규제: {len(regulations)}개
+- HIGH: {priority_count['HIGH']}개, MEDIUM: {priority_count['MEDIUM']}개, LOW: {priority_count['LOW']}개
+- 리스크 점수: {stats['total_risk_score']:.1f}/10
+- 고위험 규제: {len(stats['high_risk_items'])}개
+
+다음 형식으로 작성하세요 (마크다운):
+
+### 핵심 인사이트
+- 인사이트 1 (구체적 숫자 포함)
+- 인사이트 2
+- 인사이트 3
+
+### 의사결정 포인트
+- [ ] 결정 사항 1
+- [ ] 결정 사항 2
+- [ ] 결정 사항 3
+
+### 권장 조치 (우선순위 순)
+1. **즉시:** [조치 내용]
+2. **1개월 내:** [조치 내용]
+3. **3개월 내:** [조치 내용]
+
+간결하고 명확하게 작성하세요.
+"""
+
+
+def _render_body(
+    business_info: BusinessInfo,
+    regulations: List[Regulation],
+    checklists: List[ChecklistItem],
+    execution_plans: List[ExecutionPlan],
+    stats: Dict[str, Any]
+) -> List[str]:
+    """경영진 요약 앞부분(1장 ~ 6장)의 마크다운 조각을 작성합니다."""
+    logger.info("   통합 마크다운 보고서 작성 중...")
+
+    priority_count = stats["priority_count"]
+    category_count = stats["category_count"]
+    high_risk_items = stats["high_risk_items"]
+    total_risk_score = stats["total_risk_score"]
+    immediate_actions = stats["immediate_actions"]
 
     # 2-1. 헤더 및 사업 정보
-    full_markdown = f"""# 규제 준수 분석 통합 보고서
+    processes_text = ', '.join(business_info.get('processes', []))
+    sales_channels_text = ', '.join(business_info.get('sales_channels', []))
+    category_block = "\n".join(f"  - {cat}: {category_count[cat]}개" for cat in sorted(category_count))
+
+    # 보고서 조각을 리스트에 모아 마지막에 한 번만 이어 붙임 (문자열 += 반복 복사 방지)
+    parts: List[str] = [f"""# 규제 준수 분석 통합 보고서
 
 > 생성일: {datetime.now().strftime('%Y년 %m월 %d일')}
 
@@ -86,9 +143,9 @@ def generate_final_report(
 | **업종** | {business_info.get('industry', 'N/A')} |
 | **제품명** | {business_info.get('product_name', 'N/A')} |
 | **원자재** | {business_info.get('raw_materials', 'N/A')} |
-| **제조 공정** | {', '.join(business_info.get('processes', []))} |
+| **제조 공정** | {processes_text} |
 | **직원 수** | {business_info.get('employee_count', 0)}명 |
-| **판매 방식** | {', '.join(business_info.get('sales_channels', []))} |
+| **판매 방식** | {sales_channels_text} |
 
 ---
 
@@ -101,7 +158,7 @@ def generate_final_report(
   - 🟡 MEDIUM: {priority_count['MEDIUM']}개 (1-3개월 내 조치)
   - 🟢 LOW: {priority_count['LOW']}개 (6개월 내 조치)
 - **카테고리 분포**:
-{chr(10).join(f'  - {cat}: {count}개' for cat, count in category_count.items())}
+{category_block}
 
 ### 2.2 리스크 평가
 - **전체 리스크 점수**: {total_risk_score:.1f}/10
@@ -111,175 +168,162 @@ def generate_final_report(
 ---
 
 ## 3. 규제 목록 및 분류
-"""
+"""]
+    emit = parts.append
 
     # 2-2. 카테고리별 규제 목록
-    categories = list(set(reg['category'] for reg in regulations))
-    for i, category in enumerate(categories, 1):
-        full_markdown += f"\n### 3.{i} {category}\n\n"
-
-        category_regs = [reg for reg in regulations if reg['category'] == category]
-        for j, reg in enumerate(category_regs, 1):
-            priority_icon = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "🟢"}[reg['priority']]
-            full_markdown += f"""#### 3.{i}.{j} {priority_icon} {reg['name']}
-
-**우선순위:** {reg['priority']}
-**관할 기관:** {reg['authority']}
-**적용 이유:** {reg['why_applicable']}
-
-**주요 요구사항:**
-
-"""
+    regs_by_category: Dict[str, List[Regulation]] = {}
+    for reg in regulations:
+        regs_by_category.setdefault(reg['category'], []).append(reg)
+
+    # 카테고리는 이름순으로 정렬 (분류/검색 결과가 돌아온 순서와 무관하게 같은 보고서)
+    for i, category in enumerate(sorted(regs_by_category), 1):
+        emit(f"\n### 3.{i} {category}\n\n")
+
+        for j, reg in enumerate(regs_by_category[category], 1):
+            priority = reg['priority']
+            emit(_REG_HEADER_TMPL(
+                sec=i,
+                j=j,
+                icon=_PRIORITY_ICON[priority],
+                name=reg['name'],
+                prio=priority,
+                auth=reg['authority'],
+                why=reg['why_applicable'],
+            ))
             # 주요 요구사항을 list 형식으로 출력 (각 항목 사이에 빈 줄 추가)
             key_reqs = reg.get('key_requirements', [])
-            for idx, req in enumerate(key_reqs):
-                full_markdown += f"- {req}"
-                # 마지막 항목이 아니면 줄바꿈 추가
-                if idx < len(key_reqs) - 1:
-                    full_markdown += "\n\n"
-                else:
-                    full_markdown += "\n"
-            full_markdown += "\n"
-            if reg.get('penalty'):
-                full_markdown += f"**벌칙:** {reg['penalty']}\n\n"
-
-            if reg.get('sources'):
-                full_markdown += "**근거 출처:**\n\n"
-                for idx, src in enumerate(reg['sources']):
-                    full_markdown += f"  - {format_evidence_link(src)}"
-                    if idx < len(reg['sources']) - 1:
-                        full_markdown += "\n\n"
-                    else:
-                        full_markdown += "\n"
-                full_markdown += "\n"
+            if key_reqs:
+                emit(_bullet_block(f"- {req}" for req in key_reqs))
+            emit("\n")
+            penalty = reg.get('penalty')
+            if penalty:
+                emit(f"**벌칙:** {penalty}\n\n")
+
+            sources = reg.get('sources')
+            if sources:
+                emit("**근거 출처:**\n\n")
+                emit(_evidence_block(sources))
+                emit("\n")
 
     # 2-3. 실행 체크리스트
-    full_markdown += "\n---\n\n## 4. 실행 체크리스트\n\n"
+    emit("\n---\n\n## 4. 실행 체크리스트\n\n")
 
-    for reg in regulations:
-        reg_checklists = [c for c in checklists if c['regulation_id'] == reg['id']]
-        if reg_checklists:
-            priority_icon = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "🟢"}[reg['priority']]
-            full_markdown += f"### 4.{regulations.index(reg)+1} {priority_icon} {reg['name']}\n\n"
+    if checklists:
+        checklists_by_reg: Dict[str, List[ChecklistItem]] = {}
+        for item in checklists:
+            checklists_by_reg.setdefault(item['regulation_id'], []).append(item)
+
+        for reg_idx, reg in enumerate(regulations, 1):
+            reg_checklists = checklists_by_reg.get(reg['id'])
+            if not reg_checklists:
+                continue
+
+            priority_icon = _PRIORITY_ICON[reg['priority']]
+            emit(f"### 4.{reg_idx} {priority_icon} {reg['name']}\n\n")
 
             for item in reg_checklists:
-                full_markdown += f"- [ ] **{item['task_name']}**\n"
-                full_markdown += f"  - 담당: {item['responsible_dept']}\n"
-                full_markdown += f"  - 마감: {item['deadline']}\n"
-                full_markdown += "\n"
-                if item.get('evidence'):
-                    full_markdown += "  **근거 출처:**\n\n"
-                    for idx, ev in enumerate(item['evidence']):
-                        full_markdown += f"  - {format_evidence_link(ev)}"
-                        if idx < len(item['evidence']) - 1:
-                            full_markdown += "\n\n  "
-                        else:
-                            full_markdown += "\n"
-                    full_markdown += "\n"
+                emit(
+                    f"- [ ] **{item['task_name']}**\n"
+                    f"  - 담당: {item['responsible_dept']}\n"
+                    f"  - 마감: {item['deadline']}\n"
+                    "\n"
+                )
+                evidence = item.get('evidence')
+                if evidence:
+                    emit("  **근거 출처:**\n\n")
+                    emit(_evidence_block(evidence, sep="\n\n  "))
+                    emit("\n")
 
     # 2-4. 실행 계획 및 타임라인
-    full_markdown += "\n---\n\n## 5. 실행 계획 및 타임라인\n\n"
+    emit("\n---\n\n## 5. 실행 계획 및 타임라인\n\n")
 
-    for plan in execution_plans:
+    priority_by_reg_id = {reg['id']: reg['priority'] for reg in regulations}
+    for plan_idx, plan in enumerate(execution_plans, 1):
         reg_name = plan['regulation_name']
-        priority = next((r['priority'] for r in regulations if r['id'] == plan['regulation_id']), 'MEDIUM')
-        priority_icon = {"HIGH": "🔴", "MEDIUM": "🟡", "LOW": "🟢"}[priority]
+        priority = priority_by_reg_id.get(plan['regulation_id'], 'MEDIUM')
+        priority_icon = _PRIORITY_ICON[priority]
 
-        full_markdown += f"### 5.{execution_plans.index(plan)+1} {priority_icon} {reg_name}\n\n"
-        full_markdown += f"**타임라인:** {plan['timeline']}  \n"
-        full_markdown += f"**시작 예정:** {plan['start_date']}  \n\n"
+        emit(
+            f"### 5.{plan_idx} {priority_icon} {reg_name}\n\n"
+            f"**타임라인:** {plan['timeline']}  \n"
+            f"**시작 예정:** {plan['start_date']}  \n\n"
+        )
 
         # 마일스톤
-        if plan.get('milestones'):
-            full_markdown += "**주요 마일스톤:**\n\n"
-            milestones = plan['milestones']
-            for idx, milestone in enumerate(milestones):
-                full_markdown += f"- {milestone['name']} (완료 목표: {milestone['deadline']})"
-                # 마지막 항목이 아니면 줄바꿈 추가
-                if idx < len(milestones) - 1:
-                    full_markdown += "\n\n"
-                else:
-                    full_markdown += "\n"
-            full_markdown += "\n"
-
-        if plan.get('evidence'):
-            full_markdown += "**근거 출처:**\n\n"
-            for idx, ev in enumerate(plan['evidence']):
-                full_markdown += f"  - {format_evidence_link(ev)}"
-                if idx < len(plan['evidence']) - 1:
-                    full_markdown += "\n\n"
-                else:
-                    full_markdown += "\n"
-            full_markdown += "\n"
+        milestones = plan.get('milestones')
+        if milestones:
+            emit("**주요 마일스톤:**\n\n")
+            emit(_bullet_block(
+                f"- {milestone['name']} (완료 목표: {milestone['deadline']})"
+                for milestone in milestones
+            ))
+            emit("\n")
+
+        evidence = plan.get('evidence')
+        if evidence:
+            emit("**근거 출처:**\n\n")
+            emit(_evidence_block(evidence))
+            emit("\n")
 
     # 2-5. 리스크 평가
-    full_markdown += "\n---\n\n## 6. 리스크 평가\n\n"
-    full_markdown += f"### 6.1 전체 리스크 평가\n\n"
-    full_markdown += f"**전체 리스크 점수:** {total_risk_score:.1f}/10\n\n"
-
     risk_level = "매우 높음" if total_risk_score >= 8 else "높음" if total_risk_score >= 6 else "중간"
-    full_markdown += f"**리스크 수준:** {risk_level}\n\n"
+    emit(
+        "\n---\n\n## 6. 리스크 평가\n\n"
+        "### 6.1 전체 리스크 평가\n\n"
+        f"**전체 리스크 점수:** {total_risk_score:.1f}/10\n\n"
+        f"**리스크 수준:** {risk_level}\n\n"
+    )
 
     if high_risk_items:
-        full_markdown += "### 6.2 고위험 규제 (상위 5개)\n\n"
+        emit("### 6.2 고위험 규제 (상위 5개)\n\n")
         for item in high_risk_items[:5]:
-            full_markdown += f"#### {item['regulation_name']}\n\n"
-            full_markdown += f"**리스크 점수:** {item['risk_score']}/10\n\n"
-            full_markdown += f"**처벌 유형:** {item['penalty_type']}\n\n"
-            full_markdown += f"**사업 영향:** {item['business_impact']}\n\n"
-
-            if item.get('mitigation_priority'):
-                full_markdown += f"**완화 우선순위:** {item['mitigation_priority']}\n\n"
-
-            if item.get('evidence'):
-                full_markdown += "**근거 출처:**\n\n"
-                for idx, ev in enumerate(item['evidence']):
-                    full_markdown += f"  - {format_evidence_link(ev)}"
-                    if idx < len(item['evidence']) - 1:
-                        full_markdown += "\n\n"
-                    else:
-                        full_markdown += "\n"
-                full_markdown += "\n"
-
-    # 2-6. 경영진 요약 (LLM으로 생성)
-    print("   경영진 요약 생성 중...")
-
-    exec_summary_prompt = f"""
-다음 규제 분석 결과를 바탕으로 경영진을 위한 핵심 요약을 작성하세요.
+            emit(
+                f"#### {item['regulation_name']}\n\n"
+                f"**리스크 점수:** {item['risk_score']}/10\n\n"
+                f"**처벌 유형:** {item['penalty_type']}\n\n"
+                f"**사업 영향:** {item['business_impact']}\n\n"
+            )
 
-[분석 결과]
-- 총 규제: {len(regulations)}개
-- HIGH: {priority_count['HIGH']}개, MEDIUM: {priority_count['MEDIUM']}개, LOW: {priority_count['LOW']}개
-- 리스크 점수: {total_risk_score:.1f}/10
-- 고위험 규제: {len(high_risk_items)}개
+            mitigation_priority = item.get('mitigation_priority')
+            if mitigation_priority:
+                emit(f"**완화 우선순위:** {mitigation_priority}\n\n")
 
-다음 형식으로 작성하세요 (마크다운):
+            evidence = item.get('evidence')
+            if evidence:
+                emit("**근거 출처:**\n\n")
+                emit(_evidence_block(evidence))
+                emit("\n")
 
-### 핵심 인사이트
-- 인사이트 1 (구체적 숫자 포함)
-- 인사이트 2
-- 인사이트 3
+    return parts
 
-### 의사결정 포인트
-- [ ] 결정 사항 1
-- [ ] 결정 사항 2
-- [ ] 결정 사항 3
 
-### 권장 조치 (우선순위 순)
-1. **즉시:** [조치 내용]
-2. **1개월 내:** [조치 내용]
-3. **3개월 내:** [조치 내용]
+def _save_pdf(full_markdown: str) -> str:
+    """보고서를 PDF로 저장하고 경로(실패 시 안내 문구)를 반환합니다."""
+    try:
+        pdf_path = save_report_pdf(full_markdown, Path("report"))
+        report_pdf_path = str(pdf_path)
+        logger.info("   ✓ PDF 저장 완료: %s", report_pdf_path)
+    except Exception as e:
+        logger.warning("   ⚠ PDF 생성 실패: %s", e)
+        report_pdf_path = "PDF 생성 실패"
+    return report_pdf_path
 
-간결하고 명확하게 작성하세요.
-"""
 
-    exec_response = llm.invoke(exec_summary_prompt)
-    executive_summary = exec_response.content.strip()
+def _finish_markdown(
+    parts: List[str],
+    stats: Dict[str, Any],
+    executive_summary: str
+) -> Tuple[str, List[str]]:
+    """경영진 요약 이후 장(7장 ~ 면책 조항)을 붙여 (전체 마크다운, 다음 단계)를 반환합니다."""
+    priority_count = stats["priority_count"]
+    all_citations = stats["all_citations"]
+    emit = parts.append
 
-    full_markdown += f"\n---\n\n## 7. 경영진 요약\n\n{executive_summary}\n"
+    emit(f"\n---\n\n## 7. 경영진 요약\n\n{executive_summary}\n")
 
     # 2-7. Next Steps
-    full_markdown += "\n---\n\n## 8. 다음 단계\n\n"
+    emit("\n---\n\n## 8. 다음 단계\n\n")
 
     next_steps = [
         f"**1단계 (즉시):** HIGH 우선순위 {priority_count['HIGH']}개 규제 착수",
@@ -289,26 +333,38 @@ def generate_final_report(
         "**5단계 (분기별):** 전문가 검토 및 보완"
     ]
 
-    for step in next_steps:
-        full_markdown += f"- {step}\n"
+    emit("".join(f"- {step}\n" for step in next_steps))
 
     if all_citations:
-        full_markdown += "\n---\n\n## 9. 근거 출처 모음\n\n"
-        for idx, citation in enumerate(all_citations, 1):
-            full_markdown += f"  - {format_evidence_link(citation)}"
-            if idx < len(all_citations):
-                full_markdown += "\n\n"
-            else:
-                full_markdown += "\n"
+        emit("\n---\n\n## 9. 근거 출처 모음\n\n")
+        emit(_evidence_block(all_citations))
 
     # 2-8. 면책 조항
-    full_markdown += "\n---\n\n## 면책 조항\n\n"
-    full_markdown += "> 본 보고서는 AI 기반 분석 도구로 생성된 참고 자료입니다. "
-    full_markdown += "실제 규제 준수 여부는 반드시 전문가의 검토를 받으시기 바랍니다. "
-    full_markdown += "본 보고서 내용으로 인한 법적 책임은 사용자에게 있습니다.\n"
+    emit(
+        "\n---\n\n## 면책 조항\n\n"
+        "> 본 보고서는 AI 기반 분석 도구로 생성된 참고 자료입니다. "
+        "실제 규제 준수 여부는 반드시 전문가의 검토를 받으시기 바랍니다. "
+        "본 보고서 내용으로 인한 법적 책임은 사용자에게 있습니다.\n"
+    )
+
+    return "".join(parts), next_steps
+
+
+def _build_final_report(
+    regulations: List[Regulation],
+    stats: Dict[str, Any],
+    executive_summary: str,
+    next_steps: List[str],
+    full_markdown: str,
+    report_pdf_path: str
+) -> FinalReport:
+    """인사이트/액션 아이템을 추출하여 최종 보고서 객체를 만듭니다."""
+    priority_count = stats["priority_count"]
+    high_risk_items = stats["high_risk_items"]
+    total_risk_score = stats["total_risk_score"]
 
     # === 3. 인사이트 및 액션 아이템 추출 (구조화된 데이터) ===
-    print("   핵심 데이터 추출 중...")
+    logger.info("   핵심 데이터 추출 중...")
 
     key_insights = [
         f"총 {len(regulations)}개 규제 적용 대상 - 체계적 준수 관리 필요",
@@ -317,7 +373,7 @@ def generate_final_report(
     ]
 
     action_items = []
-    for reg in immediate_actions[:3]:
+    for reg in stats["immediate_actions"][:3]:
         action_items.append({
             "name": f"{reg['name']} 준수 조치 시작",
             "deadline": "즉시",
@@ -332,19 +388,7 @@ def generate_final_report(
             f"{item['regulation_name']} 미준수 시 {penalty} - {impact}"
         )
 
-    # === 4. PDF 저장 ===
-    print("   PDF 파일 생성 중...")
-
-    try:
-        pdf_path = save_report_pdf(full_markdown, Path("report"))
-        report_pdf_path = str(pdf_path)
-        print(f"   ✓ PDF 저장 완료: {report_pdf_path}")
-    except Exception as e:
-        print(f"   ⚠ PDF 생성 실패: {e}")
-        report_pdf_path = "PDF 생성 실패"
-
-    # === 5. 최종 보고서 반환 ===
-    final_report: FinalReport = {
+    return {
         "executive_summary": executive_summary,
         "key_insights": key_insights,
         "action_items": action_items,
@@ -352,9 +396,101 @@ def generate_final_report(
         "next_steps": next_steps,
         "full_markdown": full_markdown,
         "report_pdf_path": report_pdf_path,
-        "citations": all_citations
+        "citations": stats["all_citations"]
     }
 
-    print(f"   ✓ 통합 보고서 생성 완료\n")
 
-    return {"final_report": final_report}
\ No newline at end of file
+async def _agenerate_final_report(
+    business_info: BusinessInfo,
+    regulations: List[Regulation],
+    checklists: List[ChecklistItem],
+    execution_plans: List[ExecutionPlan],
+    risk_assessment: RiskAssessment
+) -> Dict[str, Any]:
+    """_generate_final_report의 비동기 버전: 경영진 요약을 기다리는 동안 본문을 작성."""
+    logger.info("📄 [Report Generation Agent] 통합 보고서 생성 중...")
+
+    # 경영진 요약은 통계 몇 개로 정해진 형식을 채우는 작업이므로 경량 모델 사용
+    llm = get_llm(0.7, model=LIGHT_LLM_MODEL)
+    stats = _report_stats(regulations, checklists, execution_plans, risk_assessment)
+
+    # 경영진 요약 프롬프트는 통계만 사용하므로 요청을 먼저 보내고,
+    # LLM이 응답을 생성하는 동안 마크다운 본문(1장 ~ 6장)을 작성
+    logger.info("   경영진 요약 생성 중...")
+    exec_summary_task = asyncio.ensure_future(llm.ainvoke(_exec_summary_prompt(regulations, stats)))
+    # 본문 작성은 await 없이 진행되므로, 그 전에 한 번 양보하여 요청 전송을 시작시킴
+    await asyncio.sleep(0)
+
+    try:
+        parts = _render_body(business_info, regulations, checklists, execution_plans, stats)
+    except BaseException:
+        # 본문 작성이 실패하면 응답을 받을 곳이 없으므로 요약 요청도 취소
+        exec_summary_task.cancel()
+        raise
+
+    exec_response = await exec_summary_task
+    executive_summary = exec_response.content.strip()
+    full_markdown, next_steps = _finish_markdown(parts, stats, executive_summary)
+
+    logger.info("   PDF 파일 생성 중...")
+    # WeasyPrint 렌더링은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행
+    report_pdf_path = await asyncio.to_thread(_save_pdf, full_markdown)
+
+    final_report = _build_final_report(
+        regulations, stats, executive_summary, next_steps, full_markdown, report_pdf_path
+    )
+
+    logger.info("   ✓ 통합 보고서 생성 완료")
+
+    return {"final_report": final_report}
+
+
+def _generate_final_report(
+    business_info: BusinessInfo,
+    regulations: List[Regulation],
+    checklists: List[ChecklistItem],
+    execution_plans: List[ExecutionPlan],
+    risk_assessment: RiskAssessment
+) -> Dict[str, Any]:
+    """전체 분석 결과를 통합 마크다운 보고서로 작성하고 PDF로 저장합니다.
+
+    Args:
+        business_info: 사업 정보
+        regulations: 규제 목록
+        checklists: 체크리스트
+        execution_plans: 실행 계획
+        risk_assessment: 리스크 평가
+
+    Returns:
+        최종 보고서 (통합 마크다운 + PDF 경로)
+    """
+    logger.info("📄 [Report Generation Agent] 통합 보고서 생성 중...")
+
+    llm = get_llm(0.7, model=LIGHT_LLM_MODEL)
+    stats = _report_stats(regulations, checklists, execution_plans, risk_assessment)
+
+    logger.info("   경영진 요약 생성 중...")
+    exec_response = llm.invoke(_exec_summary_prompt(regulations, stats))
+
+    executive_summary = exec_response.content.strip()
+
+    parts = _render_body(business_info, regulations, checklists, execution_plans, stats)
+    full_markdown, next_steps = _finish_markdown(parts, stats, executive_summary)
+
+    logger.info("   PDF 파일 생성 중...")
+    report_pdf_path = _save_pdf(full_markdown)
+
+    final_report = _build_final_report(
+        regulations, stats, executive_summary, next_steps, full_markdown, report_pdf_path
+    )
+
+    logger.info("   ✓ 통합 보고서 생성 완료")
+
+    return {"final_report": final_report}
+
+
+generate_final_report = StructuredTool.from_function(
+    func=_generate_final_report,
+    coroutine=_agenerate_final_report,
+    name="generate_final_report",
+)
@@ -2,61 +2,43 @@
 Risk Assessment Agent - 리스크 평가 및 완화 방안 제시
 """
 
-from typing import Dict, Any, List
-from langchain.tools import tool
-from langchain_openai import ChatOpenAI
-import json
+import logging
+from typing import Dict, Any, List, Sequence, Tuple
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.tools import StructuredTool
 
 from ..models import BusinessInfo, Regulation, RiskAssessment, RiskItem
-from ..utils import normalize_evidence_payload, ensure_dict_list
-
-
-@tool
-def assess_risks(
-    regulations: List[Regulation],
-    business_info: BusinessInfo
-) -> Dict[str, Any]:
-    """규제 미준수 시 리스크를 평가합니다.
-
-    Args:
-        regulations: 규제 목록
-        business_info: 사업 정보
-
-    Returns:
-        리스크 평가 결과
-    """
-    print("⚠️  [Risk Assessment Agent] 리스크 평가 중...")
-
-    llm = ChatOpenAI(model="gpt-4o-mini", temperature=0.7)
-
-    risk_items = []
-
-    for reg in regulations:
-        source_summary = "\n".join([
-            f"{src.get('source_id','-')} | {src.get('title','제목 없음')}\nURL: {src.get('url','')}\n발췌: {src.get('snippet','')}"
-            for src in reg.get('sources', [])
-        ]) or "등록된 출처 없음"
-
-        prompt = f"""
-다음 규제를 준수하지 않았을 때의 리스크를 평가하세요.
-근거는 [사용 가능한 출처]에서 선택한 항목만 활용하고 evidence 배열에 포함하세요.
-
-[규제 정보]
-규제명: {reg['name']}
-카테고리: {reg['category']}
-관할 기관: {reg['authority']}
-우선순위: {reg['priority']}
-적용 이유: {reg['why_applicable']}
-
-[사업 정보]
-제품: {business_info['product_name']}
-직원 수: {business_info.get('employee_count', 0)}명
-
-[사용 가능한 출처]
-{source_summary}
+from ..utils import (
+    MALFORMED_RESPONSE_ERRORS,
+    REGULATIONS_PER_PROMPT,
+    chunked,
+    format_source_summary,
+    get_llm,
+    llm_max_concurrency,
+    normalize_evidence_payload,
+    ensure_dict_list,
+    parse_llm_json
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _business_section(business_info: BusinessInfo) -> str:
+    """프롬프트의 [사업 정보] 본문 (규제마다 동일하므로 호출당 1회만 생성)."""
+    product_name = business_info['product_name']
+    employee_count = business_info.get('employee_count', 0)
+    return f"제품: {product_name}\n직원 수: {employee_count}명"
+
+
+# 고정 지시문/출력 스키마 (모든 규제·실행에서 동일한 system 메시지 → OpenAI 프롬프트 접두사 캐시 대상)
+_SYSTEM_MESSAGE = SystemMessage(content="""
+사용자가 제공하는 각 규제를 준수하지 않았을 때의 리스크를 규제별로 평가하세요.
+근거는 해당 규제의 [사용 가능한 출처]에서 선택한 항목만 활용하고 evidence 배열에 포함하세요.
+{"REG-001": {...}, "REG-002": {...}} 형태로 제공된 모든 규제의 규제 ID를 키로 하고,
+각 값은 [출력 스키마]를 따르는 JSON 객체로 출력하세요.
 
 [출력 스키마]
-{{
+{
   "penalty_amount": "벌금액 (예: 최대 1억원, 300만원 이하, 없음 \"\")",
   "penalty_type": "벌칙 유형 (형사처벌|과태료|행정처분|\"\" )",
   "business_impact": "사업 영향 (예: 영업정지 6개월, 인허가 취소, 없음 \"\")",
@@ -66,80 +48,185 @@ def assess_risks(
   ],
   "mitigation": "리스크 완화 방안 (1-2문장)",
   "evidence": [
-    {{
+    {
       "source_id": "SRC-001",
       "justification": "출처에서 인용한 핵심 문장"
-    }}
+    }
   ]
-}}
+}
 
 JSON 이외 텍스트는 금지합니다.
-"""
+""")
+
+# 묶음 입력 템플릿 (실행 내 공통인 사업 정보를 앞에 두어 같은 실행의 요청끼리 공유하는 접두사를 늘림)
+_PROMPT_TMPL = """
+[사업 정보]
+{business_section}
+{regulation_sections}""".format
+
+# 규제별 입력 블록 템플릿 (모듈 로드 시 1회 구성)
+_REG_SECTION_TMPL = """
+[규제 정보]
+규제 ID: {id}
+규제명: {name}
+카테고리: {category}
+관할 기관: {authority}
+우선순위: {priority}
+적용 이유: {why_applicable}
+
+[사용 가능한 출처]
+{source_summary}
+""".format
+
+
+def _build_prompt(regs: Sequence[Regulation], business_section: str) -> List[BaseMessage]:
+    """규제 묶음에 대한 리스크 평가 메시지 (고정 system + 묶음별 user)를 만듭니다."""
+    regulation_sections = "".join(
+        _REG_SECTION_TMPL(
+            id=reg['id'],
+            name=reg['name'],
+            category=reg['category'],
+            authority=reg['authority'],
+            priority=reg['priority'],
+            why_applicable=reg['why_applicable'],
+            source_summary=format_source_summary(reg.get('sources', [])),
+        )
+        for reg in regs
+    )
+    return [
+        _SYSTEM_MESSAGE,
+        HumanMessage(content=_PROMPT_TMPL(
+            business_section=business_section,
+            regulation_sections=regulation_sections,
+        )),
+    ]
+
+
+def _default_risk_item(reg: Regulation) -> RiskItem:
+    """평가에 실패한 규제에 사용할 기본 리스크 아이템입니다."""
+    return {
+        "regulation_id": reg['id'],
+        "regulation_name": reg['name'],
+        "penalty_amount": "",
+        "penalty_type": "",
+        "business_impact": "",
+        "risk_score": 5.0,
+        "past_cases": [],
+        "mitigation": "전문가 상담 권장",
+        "evidence": []
+    }
+
 
-        response = llm.invoke(prompt)
+def _parse_risk_item(reg: Regulation, risk_data: Any) -> RiskItem:
+    """규제 하나에 해당하는 응답 부분을 RiskItem으로 변환합니다."""
+    try:
+        if not isinstance(risk_data, dict):
+            raise ValueError(f"{reg['id']} 평가 결과가 JSON 객체가 아닙니다")
 
+        source_lookup = {
+            src.get("source_id"): src for src in reg.get("sources", [])
+            if src.get("source_id")
+        }
+
+        raw_score = risk_data.get("risk_score", 5.0)
         try:
-            content = response.content.strip()
-            if content.startswith("```"):
-                content = content.split("```")[1]
-                if content.startswith("json"):
-                    content = content[4:]
-
-            risk_data = json.loads(content.strip())
-
-            source_lookup = {
-                src.get("source_id"): src for src in reg.get("sources", [])
-                if src.get("source_id")
-            }
-
-            raw_score = risk_data.get("risk_score", 5.0)
-            try:
-                risk_score = float(raw_score)
-            except (TypeError, ValueError):
-                risk_score = 5.0
-
-            evidence_entries = normalize_evidence_payload(
-                risk_data.get("evidence"),
-                source_lookup
-            )
+            risk_score = float(raw_score)
+        except (TypeError, ValueError):
+            risk_score = 5.0
+
+        evidence_entries = normalize_evidence_payload(
+            risk_data.get("evidence"),
+            source_lookup
+        )
+
+        return {
+            "regulation_id": reg['id'],
+            "regulation_name": reg['name'],
+            "penalty_amount": risk_data.get("penalty_amount", "") or "",
+            "penalty_type": risk_data.get("penalty_type", "") or "",
+            "business_impact": risk_data.get("business_impact", "") or "",
+            "risk_score": risk_score,
+            "past_cases": risk_data.get("past_cases", []),
+            "mitigation": risk_data.get("mitigation", ""),
+            "evidence": evidence_entries
+        }
+
+    except MALFORMED_RESPONSE_ERRORS as e:
+        logger.warning("      ⚠️  파싱 오류: %s", e)
+        # 기본 리스크 아이템 추가
+        return _default_risk_item(reg)
+
+
+def _parse_chunk(regs: Sequence[Regulation], raw_content: str) -> List[RiskItem]:
+    """규제 ID를 키로 하는 LLM 응답을 묶음 내 규제별 RiskItem으로 변환합니다."""
+    try:
+        raw_payload = parse_llm_json(raw_content)
+    except MALFORMED_RESPONSE_ERRORS as e:
+        logger.warning("      ⚠️  파싱 오류: %s", e)
+        return [_default_risk_item(reg) for reg in regs]
+
+    if not isinstance(raw_payload, dict):
+        raw_payload = {}
+
+    risk_items = []
+    for reg in regs:
+        risk_data = raw_payload.get(reg['id'])
+        # 규제 하나만 보낸 묶음에서 ID 없이 평가 객체를 바로 답한 경우
+        if risk_data is None and len(regs) == 1:
+            risk_data = raw_payload
+        risk_items.append(_parse_risk_item(reg, risk_data))
+    return risk_items
+
+
+def _prepare(
+    regulations: List[Regulation],
+    business_info: BusinessInfo
+) -> Tuple[Any, List[Sequence[Regulation]], List[List[BaseMessage]]]:
+    """JSON 모드 LLM과 규제 묶음, 묶음별 프롬프트를 준비합니다 (동기/비동기 경로 공용)."""
+    logger.info("⚠️  [Risk Assessment Agent] 리스크 평가 중...")
+
+    llm = get_llm(0.7).bind(
+        response_format={"type": "json_object"}
+    )
+
+    business_section = _business_section(business_info)
 
-            risk_item: RiskItem = {
-                "regulation_id": reg['id'],
-                "regulation_name": reg['name'],
-                "penalty_amount": risk_data.get("penalty_amount", "") or "",
-                "penalty_type": risk_data.get("penalty_type", "") or "",
-                "business_impact": risk_data.get("business_impact", "") or "",
-                "risk_score": risk_score,
-                "past_cases": risk_data.get("past_cases", []),
-                "mitigation": risk_data.get("mitigation", ""),
-                "evidence": evidence_entries
-            }
-
-            risk_items.append(risk_item)
-
-        except (json.JSONDecodeError, ValueError) as e:
-            print(f"      ⚠️  파싱 오류: {e}")
-            # 기본 리스크 아이템 추가
-            risk_items.append({
-                "regulation_id": reg['id'],
-                "regulation_name": reg['name'],
-                "penalty_amount": "",
-                "penalty_type": "",
-                "business_impact": "",
-                "risk_score": 5.0,
-                "past_cases": [],
-                "mitigation": "전문가 상담 권장",
-                "evidence": []
-            })
+    # 규제 묶음마다 한 번의 호출 (고정 지시문은 묶음당 1회), 묶음들은 하나의 배치로 동시 실행
+    chunks = chunked(regulations, REGULATIONS_PER_PROMPT)
+    return llm, chunks, [_build_prompt(chunk, business_section) for chunk in chunks]
+
+
+def _collect(
+    regulations: List[Regulation],
+    chunks: List[Sequence[Regulation]],
+    responses: List[Any]
+) -> Dict[str, Any]:
+    """묶음별 배치 응답(실패는 예외 객체)을 리스크 평가 결과로 모읍니다."""
+    risk_items = []
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            logger.warning(
+                "      ⚠️  %s 리스크 평가 실패: %s",
+                ", ".join(reg['name'] for reg in chunk), response,
+            )
+            risk_items.extend(_default_risk_item(reg) for reg in chunk)
+            continue
+        risk_items.extend(_parse_chunk(chunk, response.content))
+
+    # 리스크 매트릭스 (우선순위 x 리스크 점수) - 한 번의 순회로 구간 분류 및 점수 합산
+    risk_matrix = {"HIGH": [], "MEDIUM": [], "LOW": []}
+    score_sum = 0.0
+    for item in risk_items:
+        score = item['risk_score']
+        score_sum += score
+        bucket = "HIGH" if score >= 7.0 else "MEDIUM" if score >= 4.0 else "LOW"
+        risk_matrix[bucket].append(item)
 
     # 전체 리스크 점수 계산 (가중 평균)
-    if risk_items:
-        total_risk_score = sum(item['risk_score'] for item in risk_items) / len(risk_items)
-    else:
-        total_risk_score = 0.0
+    total_risk_score = score_sum / len(risk_items) if risk_items else 0.0
 
-    # 고위험 항목 필터링 (7.0 이상)
-    high_risk_items = [item for item in risk_items if item['risk_score'] >= 7.0]
+    # 고위험 항목 (7.0 이상)
+    high_risk_items = risk_matrix["HIGH"]
 
     # 권장 사항 생성
     recommendations = []
@@ -155,13 +242,6 @@ JSON 이외 텍스트는 금지합니다.
 
     recommendations.append("월 1회 준수 현황 점검 체계 수립 권장")
 
-    # 리스크 매트릭스 (우선순위 x 리스크 점수)
-    risk_matrix = {
-        "HIGH": [item for item in risk_items if item['risk_score'] >= 7.0],
-        "MEDIUM": [item for item in risk_items if 4.0 <= item['risk_score'] < 7.0],
-        "LOW": [item for item in risk_items if item['risk_score'] < 4.0]
-    }
-
     risk_assessment: RiskAssessment = {
         "total_risk_score": round(total_risk_score, 2),
         "high_risk_items": high_risk_items,
@@ -169,7 +249,52 @@ JSON 이외 텍스트는 금지합니다.
         "recommendations": recommendations
     }
 
-    print(f"   ✓ 리스크 평가 완료: 전체 점수 {total_risk_score:.1f}/10")
-    print(f"      - 고위험 항목: {len(high_risk_items)}개\n")
+    logger.info(
+        "   ✓ 리스크 평가 완료: 전체 점수 %.1f/10, 고위험 항목 %d개",
+        total_risk_score, len(high_risk_items),
+    )
+
+    return {"risk_assessment": risk_assessment}
 
-    return {"risk_assessment": risk_assessment}
\ No newline at end of file
+
+async def _aassess_risks(
+    regulations: List[Regulation],
+    business_info: BusinessInfo
+) -> Dict[str, Any]:
+    """_assess_risks의 비동기 버전."""
+    llm, chunks, prompts = _prepare(regulations, business_info)
+    responses = await llm.abatch(
+        prompts,
+        config={"max_concurrency": llm_max_concurrency()},
+        return_exceptions=True,
+    )
+    return _collect(regulations, chunks, responses)
+
+
+def _assess_risks(
+    regulations: List[Regulation],
+    business_info: BusinessInfo
+) -> Dict[str, Any]:
+    """규제 미준수 시 리스크를 평가합니다.
+
+    Args:
+        regulations: 규제 목록
+        business_info: 사업 정보
+
+    Returns:
+        리스크 평가 결과
+    """
+    llm, chunks, prompts = _prepare(regulations, business_info)
+    responses = llm.batch(
+        prompts,
+        config={"max_concurrency": llm_max_concurrency()},
+        return_exceptions=True,
+    )
+    return _collect(regulations, chunks, responses)
+
+
+assess_risks = StructuredTool.from_function(
+    func=_assess_risks,
+    coroutine=_aassess_risks,
+    name="assess_risks",
+)
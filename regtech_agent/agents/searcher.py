@@ -2,58 +2,229 @@
 Search Agent - Tavily API를 통한 규제 정보 검색
 """
 
-from typing import Dict, Any, List
-from langchain.tools import tool
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from itertools import zip_longest
+from typing import Dict, Any, FrozenSet, Iterator, List, Optional, Tuple
+from langchain_core.tools import StructuredTool
 
-from ..utils import build_tavily_tool, extract_results, truncate
+from ..utils import build_tavily_tool, extract_results, truncate_sentence
 
+logger = logging.getLogger(__name__)
 
-@tool
-def search_regulations(keywords: List[str], user_query: str='') -> Dict[str, Any]:
-    """Tavily API를 사용하여 관련 규제 정보를 웹에서 검색합니다.
+# 쿼리 하나에 묶을 키워드 수, 검색에 사용할 최대 키워드 수, 동시 Tavily 요청 수
+KEYWORDS_PER_QUERY = 3
+MAX_QUERY_KEYWORDS = 8
+MAX_CONCURRENT_SEARCHES = 4
+# 쿼리당 결과 수 (분류 프롬프트는 상위 5개 출처만 사용하므로 쿼리마다 그만큼만 요청)
+MAX_RESULTS_PER_QUERY = 5
+DEFAULT_QUERY_SUFFIX = "제조업 규제 법률 안전 인증 한국"
+# 세션 내 검색 결과 캐시 크기 및 유효 시간 (초, 노드 결과 캐시와 동일, 동기/비동기 경로 공용)
+SEARCH_CACHE_SIZE = 32
+SEARCH_CACHE_TTL = 24 * 3600
+# 프롬프트에 넣을 발췌 길이, 본문 유사도(문자 3-gram Jaccard)가 이 값 이상이면 중복으로 제외
+CONTENT_LIMIT = 300
+NEAR_DUPLICATE_THRESHOLD = 0.85
 
-    Args:
-        keywords: 검색 키워드 목록
-        user_query: 사용자 지정 검색 쿼리 (선택 사항)
+# 출처 ID 테이블 (SRC-001 ~ SRC-999)
+_SOURCE_IDS = tuple(f"SRC-{idx:03d}" for idx in range(1000))
+
+# (키워드 조합, 사용자 쿼리) → (저장 시각, (구조화된 결과, 쿼리 수)) LRU 캐시
+_SearchKey = Tuple[Tuple[str, ...], str]
+_SearchResult = Tuple[Tuple[Dict[str, Any], ...], int]
+_SEARCH_CACHE: "OrderedDict[_SearchKey, Tuple[float, _SearchResult]]" = OrderedDict()
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+
+def _source_id(idx: int) -> str:
+    """검색 결과 순번에 해당하는 출처 ID를 반환합니다."""
+    return _SOURCE_IDS[idx] if idx < len(_SOURCE_IDS) else f"SRC-{idx:03d}"
+
+
+def _build_queries(keywords: List[str], user_query: str = "") -> List[str]:
+    """키워드를 그룹 단위로 묶어 Tavily 검색 쿼리 목록을 만듭니다."""
+    suffix = user_query or DEFAULT_QUERY_SUFFIX
+    queries = [
+        f"{' '.join(keywords[i:i + KEYWORDS_PER_QUERY])} {suffix}"
+        for i in range(0, len(keywords), KEYWORDS_PER_QUERY)
+    ]
+    return queries or [suffix]
 
-    Returns:
-        검색된 규제 정보 목록
-    """
-    print("🌐 [Search Agent] Tavily로 규제 정보 검색 중...")
-    print(f"   검색 키워드: {', '.join(keywords[:3])}...")
 
-    # TavilySearch 도구 생성
-    tavily_tool = build_tavily_tool(max_results=10, search_depth="advanced")
+async def _run_queries(tavily_tool, queries: List[str]) -> List[Any]:
+    """여러 쿼리를 동시에 실행합니다 (동시 요청 수는 세마포어로 제한)."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SEARCHES)
 
-    # 검색 쿼리 생성
-    if user_query:
-        query = f"{' '.join(keywords)} {user_query}"
-    else:
-        query = f"{' '.join(keywords)} 제조업 규제 법률 안전 인증 한국"
+    async def _search(query: str) -> Any:
+        async with semaphore:
+            return await tavily_tool.ainvoke({"query": query})
 
-    # Tavily 검색 실행
-    raw = tavily_tool.invoke({"query": query})
+    return await asyncio.gather(*(_search(query) for query in queries))
 
-    # 결과 추출
-    search_results = extract_results(raw)
 
-    print(f"   ✓ 검색 결과: {len(search_results)}개 문서 발견")
-    for idx, result in enumerate(search_results[:3], 1):
-        print(f"      {idx}. {result.get('title', 'N/A')[:60]}...")
-    if len(search_results) > 3:
-        print(f"      ... 외 {len(search_results) - 3}개\n")
-    else:
-        print()
+def _shingles(text: str) -> FrozenSet[str]:
+    """본문 유사도 비교용 문자 3-gram 집합 (공백/대소문자 무시)."""
+    compact = "".join(text.split()).casefold()
+    return frozenset(compact[i:i + 3] for i in range(len(compact) - 2))
 
-    # 검색 결과 구조화
+
+def _is_near_duplicate(shingles: FrozenSet[str], kept: List[FrozenSet[str]]) -> bool:
+    if not shingles:
+        return False
+    for other in kept:
+        union = len(shingles | other)
+        if union and len(shingles & other) / union >= NEAR_DUPLICATE_THRESHOLD:
+            return True
+    return False
+
+
+def _interleave(groups: List[List[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """각 쿼리의 결과를 순위별로 번갈아 반환합니다 (1위들, 2위들, ...)."""
+    for rank_items in zip_longest(*groups):
+        for item in rank_items:
+            if item is not None:
+                yield item
+
+
+def _structure_results(raw_responses: List[Any]) -> Tuple[Dict[str, Any], ...]:
+    """쿼리별 응답을 합쳐 구조화합니다 (URL/제목/본문 유사도 기준 중복 제거, 먼저 등장한 결과 유지)."""
+    seen_urls = set()
+    seen_titles = set()
+    kept_shingles: List[FrozenSet[str]] = []
     structured_results = []
-    for idx, item in enumerate(search_results, 1):
+    # 쿼리별 결과를 번갈아 합쳐 앞쪽 출처(분류 프롬프트에 들어가는 상위 결과)가 모든 키워드 그룹을 포함하도록 함
+    per_query = [list(extract_results(raw)) for raw in raw_responses]
+    for item in _interleave(per_query):
+        url = item.get("url", "")
+        if url:
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+        # 같은 문서가 다른 URL(미러, 쿼리스트링 등)로 중복 수집된 경우 제외
+        title = item.get("title", "")
+        title_key = " ".join(title.split()).casefold()
+        if title_key:
+            if title_key in seen_titles:
+                continue
+            seen_titles.add(title_key)
+        # 발췌는 문장 경계에서 한 번만 잘라 저장 (이후 프롬프트에서 다시 자르지 않음)
+        content = truncate_sentence(item.get("content", ""), CONTENT_LIMIT)
+        # 같은 내용이 다른 사이트에 전재된 경우 제외하여 프롬프트 토큰 절감
+        shingles = _shingles(content)
+        if _is_near_duplicate(shingles, kept_shingles):
+            continue
+        kept_shingles.append(shingles)
         structured_results.append({
-            "source_id": f"SRC-{idx:03d}",
-            "title": item.get("title", ""),
-            "url": item.get("url", ""),
-            "content": truncate(item.get("content", ""), 300),
+            "source_id": _source_id(len(structured_results) + 1),
+            "title": title,
+            "url": url,
+            "content": content,
             "score": item.get("score", 0.0),
         })
+    return tuple(structured_results)
+
+
+def _cache_get(key: _SearchKey) -> Optional[_SearchResult]:
+    with _SEARCH_CACHE_LOCK:
+        entry = _SEARCH_CACHE.get(key)
+        if entry is None:
+            return None
+        stored_at, cached = entry
+        # 장기 실행 서버에서 오래된 검색 결과가 계속 반환되지 않도록 만료된 항목은 제거
+        if time.monotonic() - stored_at > SEARCH_CACHE_TTL:
+            del _SEARCH_CACHE[key]
+            return None
+        _SEARCH_CACHE.move_to_end(key)
+        return cached
+
+
+def _cache_put(key: _SearchKey, value: _SearchResult) -> None:
+    with _SEARCH_CACHE_LOCK:
+        _SEARCH_CACHE[key] = (time.monotonic(), value)
+        _SEARCH_CACHE.move_to_end(key)
+        if len(_SEARCH_CACHE) > SEARCH_CACHE_SIZE:
+            _SEARCH_CACHE.popitem(last=False)
+
+
+def _start_search(keywords: List[str], user_query: str) -> Tuple[_SearchKey, Optional[_SearchResult]]:
+    """검색 키(상위 키워드 조합 + 사용자 쿼리)와 캐시된 결과(없으면 None)를 반환합니다."""
+    logger.info("🌐 [Search Agent] Tavily로 규제 정보 검색 중...")
+    logger.info("   검색 키워드: %s...", ', '.join(keywords[:3]))
+
+    # 쿼리 길이 제한: 상위 키워드만 사용
+    key = (tuple(keywords[:MAX_QUERY_KEYWORDS]), user_query)
+    return key, _cache_get(key)
 
+
+def _plan_queries(key: _SearchKey) -> Tuple[Any, List[str]]:
+    """TavilySearch 도구와 키워드 그룹별 검색 쿼리 목록을 준비합니다."""
+    tavily_tool = build_tavily_tool(max_results=MAX_RESULTS_PER_QUERY, search_depth="advanced")
+    query_keywords, user_query = key
+    return tavily_tool, _build_queries(list(query_keywords), user_query)
+
+
+def _finalize_results(key: _SearchKey, queries: List[str], raw_responses: List[Any]) -> _SearchResult:
+    """쿼리별 응답을 구조화하여 캐시에 저장합니다."""
+    result = (_structure_results(raw_responses), len(queries))
+    _cache_put(key, result)
+    return result
+
+
+def _search_output(result: _SearchResult) -> Dict[str, Any]:
+    """캐시된 결과를 호출자별 복사본으로 만들어 반환합니다."""
+    cached_results, query_count = result
+    structured_results = [dict(item) for item in cached_results]
+
+    _report(structured_results, query_count)
     return {"search_results": structured_results}
+
+
+def _report(structured_results: List[Dict[str, Any]], query_count: int) -> None:
+    if not logger.isEnabledFor(logging.INFO):
+        return
+    logger.info("   ✓ 검색 결과: %d개 문서 발견 (쿼리 %d개)", len(structured_results), query_count)
+    for idx, result in enumerate(structured_results[:3], 1):
+        logger.info("      %d. %s...", idx, result['title'][:60] or 'N/A')
+    if len(structured_results) > 3:
+        logger.info("      ... 외 %d개", len(structured_results) - 3)
+
+
+def _search_regulations(keywords: List[str], user_query: str = '') -> Dict[str, Any]:
+    """Tavily API를 사용하여 관련 규제 정보를 웹에서 검색합니다.
+
+    Args:
+        keywords: 검색 키워드 목록
+        user_query: 사용자 지정 검색 쿼리 (선택 사항)
+
+    Returns:
+        검색된 규제 정보 목록
+    """
+    key, result = _start_search(keywords, user_query)
+    if result is None:
+        tavily_tool, queries = _plan_queries(key)
+        raw_responses = tavily_tool.batch(
+            [{"query": query} for query in queries],
+            config={"max_concurrency": MAX_CONCURRENT_SEARCHES},
+        )
+        result = _finalize_results(key, queries, raw_responses)
+    return _search_output(result)
+
+
+async def _asearch_regulations(keywords: List[str], user_query: str = '') -> Dict[str, Any]:
+    """_search_regulations의 비동기 버전."""
+    key, result = _start_search(keywords, user_query)
+    if result is None:
+        tavily_tool, queries = _plan_queries(key)
+        raw_responses = await _run_queries(tavily_tool, queries)
+        result = _finalize_results(key, queries, raw_responses)
+    return _search_output(result)
+
+
+search_regulations = StructuredTool.from_function(
+    func=_search_regulations,
+    coroutine=_asearch_regulations,
+    name="search_regulations",
+)
@@ -4,21 +4,45 @@ Email utility helpers for RegTech Agent.
 
 from __future__ import annotations
 
+import base64
+import logging
 import os
+import re
 import smtplib
 import ssl
+import time
+from io import BytesIO
+from itertools import islice
 from pathlib import Path
+from string import Template
 from typing import Dict, Any, Optional, Tuple, List
-from datetime import datetime
 
+import aiosmtplib
 from dotenv import load_dotenv
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from email.mime.application import MIMEApplication
+from email import policy
+from email.message import EmailMessage, MIMEPart
 
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# 57 bytes encode to one 76-char base64 line, so chunks stay line-aligned.
+_ATTACHMENT_CHUNK_SIZE = 57 * 1024
+
+# Load the CA bundle once per process; SSLContext is thread-safe once configured.
+_SSL_CONTEXT = ssl.create_default_context()
+
+# local@domain.tld: exactly one "@", no whitespace, a dot inside the domain.
+_EMAIL_RE = re.compile(r"[^@\s]+@[^@\s]+\.[^@\s]+")
+
+_EXEC_SUMMARY_PHRASE_RE = re.compile(r"executive summary", re.IGNORECASE)
+# "## ... Executive Summary ..." heading up to the next "#" heading (or EOF).
+_EXEC_SUMMARY_RE = re.compile(
+    r"^[ \t]*##[^\n]*executive summary[^\n]*(?:\n|\Z)(.*?)(?=^[ \t]*#|\Z)",
+    re.IGNORECASE | re.MULTILINE | re.DOTALL,
+)
+
 
 def prepare_email_recipient(
     provided_email: Optional[str],
@@ -35,7 +59,7 @@ def prepare_email_recipient(
     if not candidate:
         return "", "수신자 이메일이 비어 있습니다."
 
-    if "@" not in candidate or candidate.count("@") != 1 or "." not in candidate.split("@")[1]:
+    if not _EMAIL_RE.fullmatch(candidate):
         return candidate, "유효하지 않은 이메일 형식입니다. 예: user@example.com"
 
     return candidate, None
@@ -46,103 +70,133 @@ def extract_executive_summary(markdown_report: str) -> str:
     if not markdown_report:
         return ""
 
-    lines = markdown_report.splitlines()
-    summary_lines = []
-    in_summary = False
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        if stripped.lower().startswith("##") and "executive summary" in stripped.lower():
-            in_summary = True
-            continue
-        if in_summary and stripped.startswith("#"):
-            break
-        if in_summary:
-            summary_lines.append(stripped)
-
-    if summary_lines:
-        return "\n".join(summary_lines)
+    # Cheap substring scan first; only run the regex from the first candidate line.
+    phrase = _EXEC_SUMMARY_PHRASE_RE.search(markdown_report)
+    match = None
+    if phrase:
+        line_start = markdown_report.rfind("\n", 0, phrase.start()) + 1
+        match = _EXEC_SUMMARY_RE.search(markdown_report, line_start)
+    if match:
+        summary = "\n".join(
+            line.strip() for line in match.group(1).splitlines() if line.strip()
+        )
+        if summary:
+            return summary
 
     return markdown_report[:500] + ("..." if len(markdown_report) > 500 else "")
 
 
-def create_email_body(
-    summary: str,
-    analysis_scope: Dict[str, Any],
-    pdf_filename: str,
-    checklist_count: int = 0,
-    plan_count: int = 0,
-    insights: Optional[List[str]] = None,
-    next_steps: Optional[List[str]] = None,
-) -> str:
-    """Build HTML email body summarizing the report with checklist style."""
-    insights = insights or []
-    next_steps = next_steps or []
-
-    insights_html = "".join(f"<li>{item}</li>" for item in insights[:5]) or "<li>등록된 인사이트가 없습니다.</li>"
-    next_steps_html = "".join(f"<li>{item}</li>" for item in next_steps[:5]) or "<li>다음 단계 제안이 없습니다.</li>"
+_PLAIN_TEXT_FALLBACK = "HTML 형식의 메일입니다. HTML을 지원하는 메일 클라이언트에서 확인해주세요."
+_SUMMARY_EMPTY = "<p>요약 정보가 없습니다.</p>"
+_INSIGHTS_EMPTY = "<li>등록된 인사이트가 없습니다.</li>"
+_NEXT_STEPS_EMPTY = "<li>다음 단계 제안이 없습니다.</li>"
 
-    return f"""
+_EMAIL_HEAD_HTML = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="UTF-8">
         <style>
-            body {{ font-family: Arial, sans-serif; line-height: 1.6; color: #333; }}
-            .container {{ max-width: 720px; margin: 0 auto; padding: 20px; }}
-            .header {{ background-color: #1f5ca6; color: white; padding: 18px 22px; border-radius: 6px; }}
-            .section {{ margin-top: 24px; padding: 18px 22px; background-color: #f7f9fc; border-radius: 6px; }}
-            h1 {{ margin: 0 0 6px 0; font-size: 22px; }}
-            h2 {{ margin-top: 0; color: #1f5ca6; }}
-            ul {{ padding-left: 20px; }}
-            .footer {{ margin-top: 32px; font-size: 12px; color: #6b7280; text-align: center; }}
-            .badge {{ display: inline-block; background-color: #2563eb; color: #fff; padding: 4px 10px; border-radius: 12px; font-size: 12px; margin-right: 8px; }}
+            body { font-family: Arial, sans-serif; line-height: 1.6; color: #333; }
+            .container { max-width: 720px; margin: 0 auto; padding: 20px; }
+            .header { background-color: #1f5ca6; color: white; padding: 18px 22px; border-radius: 6px; }
+            .section { margin-top: 24px; padding: 18px 22px; background-color: #f7f9fc; border-radius: 6px; }
+            h1 { margin: 0 0 6px 0; font-size: 22px; }
+            h2 { margin-top: 0; color: #1f5ca6; }
+            ul { padding-left: 20px; }
+            .footer { margin-top: 32px; font-size: 12px; color: #6b7280; text-align: center; }
+            .badge { display: inline-block; background-color: #2563eb; color: #fff; padding: 4px 10px; border-radius: 12px; font-size: 12px; margin-right: 8px; }
         </style>
     </head>
     <body>
         <div class="container">
-            <div class="header">
+"""
+
+_EMAIL_SECTIONS_TEMPLATE = Template("""            <div class="header">
                 <h1>규제 준수 분석 결과</h1>
-                <p>{datetime.now().strftime('%Y-%m-%d %H:%M')}</p>
+                <p>$timestamp</p>
             </div>
 
             <div class="section">
                 <h2>요약</h2>
-                <span class="badge">체크리스트 {checklist_count}건</span>
-                <span class="badge">실행 계획 {plan_count}건</span>
+                <span class="badge">체크리스트 $checklist_count건</span>
+                <span class="badge">실행 계획 $plan_count건</span>
                 <div style="margin-top: 16px;">
-                    {summary or '<p>요약 정보가 없습니다.</p>'}
+                    $summary
                 </div>
             </div>
 
             <div class="section">
                 <h2>핵심 인사이트</h2>
                 <ul>
-                    {insights_html}
+                    $insights
                 </ul>
             </div>
 
             <div class="section">
                 <h2>다음 단계 제안</h2>
                 <ul>
-                    {next_steps_html}
+                    $next_steps
                 </ul>
             </div>
 
-            <div class="footer">
+""")
+
+_EMAIL_FOOTER_FMT = """            <div class="footer">
                 <p>이 메일은 RegTech Assistant가 자동으로 발송했습니다.</p>
                 <p>첨부된 PDF 보고서를 참고해주세요. ({pdf_filename})</p>
             </div>
         </div>
     </body>
     </html>
-    """
+    """.format
 
 
-class EmailSender:
-    """SMTP email sender using Gmail credentials."""
+def create_email_body(
+    summary: str,
+    analysis_scope: Dict[str, Any],
+    pdf_filename: str,
+    checklist_count: int = 0,
+    plan_count: int = 0,
+    insights: Optional[List[str]] = None,
+    next_steps: Optional[List[str]] = None,
+) -> str:
+    """Build HTML email body summarizing the report with checklist style."""
+    insights_html = "".join(
+        f"<li>{item}</li>" for item in islice(insights or (), 5)
+    ) or _INSIGHTS_EMPTY
+    next_steps_html = "".join(
+        f"<li>{item}</li>" for item in islice(next_steps or (), 5)
+    ) or _NEXT_STEPS_EMPTY
+
+    sections_html = _EMAIL_SECTIONS_TEMPLATE.substitute(
+        timestamp=time.strftime("%Y-%m-%d %H:%M", time.localtime()),
+        checklist_count=checklist_count,
+        plan_count=plan_count,
+        summary=summary or _SUMMARY_EMPTY,
+        insights=insights_html,
+        next_steps=next_steps_html,
+    )
+    return _EMAIL_HEAD_HTML + sections_html + _EMAIL_FOOTER_FMT(pdf_filename=pdf_filename)
+
+
+def _build_pdf_attachment(pdf_path: Path) -> MIMEPart:
+    """Build a base64 PDF attachment, encoding the file chunk by chunk."""
+    encoded = BytesIO()
+    with pdf_path.open("rb") as file_handle:
+        for chunk in iter(lambda: file_handle.read(_ATTACHMENT_CHUNK_SIZE), b""):
+            encoded.write(base64.encodebytes(chunk))
+
+    attachment = MIMEPart(policy=policy.SMTP)
+    attachment["Content-Type"] = "application/pdf"
+    attachment["Content-Transfer-Encoding"] = "base64"
+    attachment.add_header("Content-Disposition", "attachment", filename=pdf_path.name)
+    attachment.set_payload(encoded.getvalue().decode("ascii"))
+    return attachment
+
+
+class _BaseEmailSender:
+    """Credential handling and message assembly shared by the senders."""
 
     def __init__(
         self,
@@ -164,9 +218,85 @@ class EmailSender:
             "Gmail 인증 정보가 설정되지 않았습니다. "
             "GMAIL_SENDER_EMAIL / GMAIL_APP_PASSWORD 환경 변수를 확인하세요."
         )
-        print(f"⚠️  {self.last_error}")
+        logger.warning("⚠️  %s", self.last_error)
         return False
 
+    def _build_message(
+        self,
+        recipient_email: str,
+        subject: str,
+        body: str,
+        pdf_path: Optional[Path] = None,
+    ) -> EmailMessage:
+        message = EmailMessage(policy=policy.SMTP)
+        message["From"] = self.sender_email
+        message["To"] = recipient_email
+        message["Subject"] = subject
+
+        message.set_content(_PLAIN_TEXT_FALLBACK)
+        message.add_alternative(body, subtype="html")
+
+        if pdf_path and pdf_path.exists():
+            message.make_mixed()
+            message.attach(_build_pdf_attachment(pdf_path))
+
+        return message
+
+
+class EmailSender(_BaseEmailSender):
+    """SMTP email sender using Gmail credentials.
+
+    The authenticated SMTP connection is kept open and reused across
+    ``send_report`` calls; it is checked with NOOP before each use and
+    re-established on failure. Call ``close()`` when done.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._smtp: Optional[smtplib.SMTP] = None
+
+    def _get_connection(self) -> smtplib.SMTP:
+        """Return a live authenticated SMTP connection, reconnecting if needed."""
+        if self._smtp is not None:
+            try:
+                if self._smtp.noop()[0] == 250:
+                    return self._smtp
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._discard_connection()
+
+        server = smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30)
+        try:
+            server.ehlo()
+            server.starttls(context=_SSL_CONTEXT)
+            server.ehlo()
+            server.login(self.sender_email, self.sender_password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        return server
+
+    def _discard_connection(self) -> None:
+        """Drop the cached connection without a graceful QUIT."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.close()
+        finally:
+            self._smtp = None
+
+    def close(self) -> None:
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        finally:
+            self._discard_connection()
+
     def send_report(
         self,
         recipient_email: str,
@@ -181,35 +311,97 @@ class EmailSender:
             return False
 
         try:
-            message = MIMEMultipart()
-            message["From"] = self.sender_email
-            message["To"] = recipient_email
-            message["Subject"] = subject
-
-            message.attach(MIMEText(body, "html", "utf-8"))
-
-            if pdf_path and pdf_path.exists():
-                with pdf_path.open("rb") as file_handle:
-                    attachment = MIMEApplication(file_handle.read(), _subtype="pdf")
-                    attachment.add_header(
-                        "Content-Disposition",
-                        "attachment",
-                        filename=pdf_path.name,
-                    )
-                    message.attach(attachment)
-
-            with smtplib.SMTP(self.smtp_server, self.smtp_port, timeout=30) as server:
-                server.ehlo()
-                context = ssl.create_default_context()
-                server.starttls(context=context)
-                server.ehlo()
-                server.login(self.sender_email, self.sender_password)
-                server.send_message(message)
-
-            print(f"✅ 이메일 발송 성공: {recipient_email}")
+            message = self._build_message(recipient_email, subject, body, pdf_path)
+
+            try:
+                self._get_connection().send_message(message)
+            except smtplib.SMTPServerDisconnected:
+                # Stale cached connection: reconnect and retry once. Other SMTP
+                # errors (auth, refused recipients, DATA) are not retried.
+                self._discard_connection()
+                self._get_connection().send_message(message)
+
+            logger.info("✅ 이메일 발송 성공: %s", recipient_email)
+            return True
+
+        except Exception as exc:
+            self.last_error = str(exc)
+            logger.warning("❌ 이메일 발송 실패: %s", exc)
+            return False
+
+
+class AsyncEmailSender(_BaseEmailSender):
+    """aiosmtplib-based sender for use inside a running event loop.
+
+    The authenticated client is reused across ``send_report`` calls on the
+    same sender instance only; it is bound to the event loop that created it,
+    so senders are not shared between loops or tool calls. Call ``close()``
+    (awaited) before the event loop shuts down.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._client: Optional[aiosmtplib.SMTP] = None
+
+    async def _get_client(self) -> aiosmtplib.SMTP:
+        """Return a connected, authenticated client, reconnecting if needed."""
+        if self._client is not None and self._client.is_connected:
+            return self._client
+
+        client = aiosmtplib.SMTP(
+            hostname=self.smtp_server,
+            port=self.smtp_port,
+            start_tls=True,
+            tls_context=_SSL_CONTEXT,
+            timeout=30,
+        )
+        await client.connect()
+        try:
+            await client.login(self.sender_email, self.sender_password)
+        except Exception:
+            client.close()
+            raise
+        self._client = client
+        return client
+
+    async def close(self) -> None:
+        """Close the shared SMTP client, if any."""
+        if self._client is None:
+            return
+        try:
+            await self._client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            self._client.close()
+        finally:
+            self._client = None
+
+    async def send_report(
+        self,
+        recipient_email: str,
+        subject: str,
+        body: str,
+        pdf_path: Optional[Path] = None,
+    ) -> bool:
+        """Send report email with optional PDF attachment."""
+        self.last_error = None
+
+        if not self._ensure_credentials():
+            return False
+
+        try:
+            message = self._build_message(recipient_email, subject, body, pdf_path)
+
+            try:
+                await (await self._get_client()).send_message(message)
+            except aiosmtplib.SMTPServerDisconnected:
+                # Stale shared client: reconnect and retry once.
+                self._client = None
+                await (await self._get_client()).send_message(message)
+
+            logger.info("✅ 이메일 발송 성공: %s", recipient_email)
             return True
 
         except Exception as exc:
             self.last_error = str(exc)
-            print(f"❌ 이메일 발송 실패: {exc}")
+            logger.warning("❌ 이메일 발송 실패: %s", exc)
             return False
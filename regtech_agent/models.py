@@ -131,7 +131,6 @@ class AgentState(TypedDict, total=False):
     keywords: List[str]
     search_results: List[Dict[str, Any]]
     regulations: List[Regulation]
-    final_output: Dict[str, Any]
 
     # Agent 결과 필드
     checklists: List[ChecklistItem]     # 체크리스트 목록
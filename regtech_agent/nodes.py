@@ -25,19 +25,42 @@ def analyzer_node(state: AgentState) -> Dict[str, Any]:
     return {"keywords": result["keywords"]}
 
 
+async def aanalyzer_node(state: AgentState) -> Dict[str, Any]:
+    """분석 노드 (비동기)."""
+    result = await analyze_business.ainvoke({"business_info": state["business_info"]})
+    return {"keywords": result["keywords"]}
+
+
 def search_node(state: AgentState) -> Dict[str, Any]:
     """검색 노드: 키워드를 사용하여 규제 정보를 검색합니다."""
     result = search_regulations.invoke({"keywords": state["keywords"]})
     return {"search_results": result["search_results"]}
 
 
+async def asearch_node(state: AgentState) -> Dict[str, Any]:
+    """검색 노드 (비동기): 키워드 그룹별 Tavily 쿼리를 호출자의 이벤트 루프에서 동시 실행합니다."""
+    result = await search_regulations.ainvoke({"keywords": state["keywords"]})
+    return {"search_results": result["search_results"]}
+
+
 def classifier_node(state: AgentState) -> Dict[str, Any]:
     """분류 노드: 검색 결과를 분석하여 규제를 분류합니다."""
     result = classify_regulations.invoke({
         "business_info": state["business_info"],
         "search_results": state["search_results"]
     })
-    return {"regulations": result["regulations"]}
+    # 검색 결과는 분류 이후 사용되지 않으므로 상태에서 비워 체크포인트 크기를 줄임
+    return {"regulations": result["regulations"], "search_results": []}
+
+
+async def aclassifier_node(state: AgentState) -> Dict[str, Any]:
+    """분류 노드 (비동기)."""
+    result = await classify_regulations.ainvoke({
+        "business_info": state["business_info"],
+        "search_results": state["search_results"]
+    })
+    # 검색 결과는 분류 이후 사용되지 않으므로 상태에서 비워 체크포인트 크기를 줄임
+    return {"regulations": result["regulations"], "search_results": []}
 
 
 def prioritizer_node(state: AgentState) -> Dict[str, Any]:
@@ -49,12 +72,27 @@ def prioritizer_node(state: AgentState) -> Dict[str, Any]:
     return {"regulations": result["regulations"]}
 
 
+async def aprioritizer_node(state: AgentState) -> Dict[str, Any]:
+    """우선순위 노드 (비동기)."""
+    result = await prioritize_regulations.ainvoke({
+        "business_info": state["business_info"],
+        "regulations": state["regulations"]
+    })
+    return {"regulations": result["regulations"]}
+
+
 def checklist_generator_node(state: AgentState) -> Dict[str, Any]:
     """체크리스트 노드: 규제별 체크리스트를 생성합니다."""
     result = generate_checklists.invoke({"regulations": state["regulations"]})
     return {"checklists": result["checklists"]}
 
 
+async def achecklist_generator_node(state: AgentState) -> Dict[str, Any]:
+    """체크리스트 노드 (비동기): risk_assessor와 같은 이벤트 루프에서 동시 실행됩니다."""
+    result = await generate_checklists.ainvoke({"regulations": state["regulations"]})
+    return {"checklists": result["checklists"]}
+
+
 def planning_agent_node(state: AgentState) -> Dict[str, Any]:
     """계획 노드: 실행 계획을 수립합니다."""
     result = plan_execution.invoke({
@@ -64,6 +102,15 @@ def planning_agent_node(state: AgentState) -> Dict[str, Any]:
     return {"execution_plans": result["execution_plans"]}
 
 
+async def aplanning_agent_node(state: AgentState) -> Dict[str, Any]:
+    """계획 노드 (비동기)."""
+    result = await plan_execution.ainvoke({
+        "regulations": state["regulations"],
+        "checklists": state["checklists"]
+    })
+    return {"execution_plans": result["execution_plans"]}
+
+
 def risk_assessor_node(state: AgentState) -> Dict[str, Any]:
     """리스크 노드: 리스크를 평가합니다."""
     result = assess_risks.invoke({
@@ -73,6 +120,15 @@ def risk_assessor_node(state: AgentState) -> Dict[str, Any]:
     return {"risk_assessment": result["risk_assessment"]}
 
 
+async def arisk_assessor_node(state: AgentState) -> Dict[str, Any]:
+    """리스크 노드 (비동기): checklist_generator와 같은 이벤트 루프에서 동시 실행됩니다."""
+    result = await assess_risks.ainvoke({
+        "regulations": state["regulations"],
+        "business_info": state["business_info"]
+    })
+    return {"risk_assessment": result["risk_assessment"]}
+
+
 def report_generator_node(state: AgentState) -> Dict[str, Any]:
     """보고서 노드: 최종 보고서를 생성합니다."""
     result = generate_final_report.invoke({
@@ -85,21 +141,45 @@ def report_generator_node(state: AgentState) -> Dict[str, Any]:
     return {"final_report": result["final_report"]}
 
 
-def email_notifier_node(state: AgentState) -> Dict[str, Any]:
-    """이메일 노드: 최종 보고서를 지정된 이메일로 발송합니다."""
-    existing_status = state.get("email_status") or {}
-    if existing_status.get("attempted"):
-        return {}
+async def areport_generator_node(state: AgentState) -> Dict[str, Any]:
+    """보고서 노드 (비동기)."""
+    result = await generate_final_report.ainvoke({
+        "business_info": state["business_info"],
+        "regulations": state["regulations"],
+        "checklists": state["checklists"],
+        "execution_plans": state["execution_plans"],
+        "risk_assessment": state["risk_assessment"]
+    })
+    return {"final_report": result["final_report"]}
+
 
+def _email_notifier_payload(state: AgentState) -> Dict[str, Any]:
     final_report: FinalReport = state.get("final_report", {})
     business_info: BusinessInfo = state.get("business_info", {})
-    recipients = state.get("email_recipients") or []
-
-    result = send_final_report_email.invoke({
+    return {
         "final_report": final_report,
         "business_info": business_info,
         "checklists": state.get("checklists", []),
         "execution_plans": state.get("execution_plans", []),
-        "recipient_emails": recipients,
-    })
+        "recipient_emails": state.get("email_recipients") or [],
+    }
+
+
+def email_notifier_node(state: AgentState) -> Dict[str, Any]:
+    """이메일 노드: 최종 보고서를 지정된 이메일로 발송합니다."""
+    existing_status = state.get("email_status") or {}
+    if existing_status.get("attempted"):
+        return {}
+
+    result = send_final_report_email.invoke(_email_notifier_payload(state))
+    return {"email_status": result["email_status"]}
+
+
+async def aemail_notifier_node(state: AgentState) -> Dict[str, Any]:
+    """이메일 노드 (비동기): aiosmtplib으로 발송하여 이벤트 루프를 막지 않습니다."""
+    existing_status = state.get("email_status") or {}
+    if existing_status.get("attempted"):
+        return {}
+
+    result = await send_final_report_email.ainvoke(_email_notifier_payload(state))
     return {"email_status": result["email_status"]}
@@ -2,21 +2,267 @@
 RegTech Agent Helper 함수들
 """
 
+import os
 import re
+import asyncio
 import json
-from typing import List, Dict, Any, Iterable, Union
+import time
+import hashlib
+import logging
+import sqlite3
+import threading
+from functools import lru_cache
+from typing import TYPE_CHECKING, List, Dict, Any, Iterable, Iterator, Optional, Sequence, Tuple, Union
 from pathlib import Path
-from markdown import markdown
-from weasyprint import HTML, CSS
 from urllib.parse import urlparse
 
-from langchain_tavily import TavilySearch
+from langchain_core.caches import BaseCache
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult, Generation
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from langchain_openai import ChatOpenAI
 
 from .models import EvidenceItem, Milestone
 
+if TYPE_CHECKING:
+    from langchain_tavily import TavilySearch
+
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    _json_loads = json.loads
+
+_TASK_SPLIT_RE = re.compile(r"[,\s]+")
+_SRC_RE = re.compile(r"(SRC-\d+)")
+_CODE_FENCE_RE = re.compile(r"^```[A-Za-z]*\s*|\s*```$")
+_SENTENCE_ENDS = (". ", "! ", "? ", "。")
+
+# PDF 스타일시트 원문
+_PDF_CSS_TEXT = """
+    @page { size: A4; margin: 20mm; }
+    body { font-family: 'Apple SD Gothic Neo', 'Nanum Gothic', 'Noto Sans CJK KR', sans-serif; font-size: 11pt; line-height: 1.6; }
+    h1, h2, h3 { color: #1a237e; }
+    h1 { border-bottom: 3px solid #1a237e; padding-bottom: 10px; }
+    h2 { border-bottom: 1px solid #9fa8da; padding-bottom: 5px; margin-top: 20px; }
+    ul { margin-left: 0; padding-left: 15px; }
+    li { margin-bottom: 6px; }
+    table { border-collapse: collapse; width: 100%; margin: 12px 0; }
+    th, td { border: 1px solid #bdbdbd; padding: 8px; text-align: left; }
+    th { background-color: #e8eaf6; font-weight: bold; }
+    code, pre { background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
+    blockquote { border-left: 4px solid #1a237e; padding-left: 10px; color: #555; }
+    """
+
+# Markdown 변환 잠금 (변환기 인스턴스는 스레드 간 공유)
+_MD_LOCK = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _pdf_toolkit() -> Tuple[Any, Any, Any, Any]:
+    """PDF 생성에 필요한 (Markdown 변환기, HTML 클래스, CSS, 폰트 설정)을 반환합니다.
+
+    WeasyPrint(cairo/pango/cffi 로딩)와 Markdown 확장은 import 비용이 크므로
+    모듈 로드 시가 아니라 첫 PDF 생성 시 1회만 import/파싱하여 재사용합니다.
+    """
+    from markdown import Markdown
+    from weasyprint import HTML, CSS
+    from weasyprint.text.fonts import FontConfiguration
+
+    font_config = FontConfiguration()
+    pdf_css = CSS(string=_PDF_CSS_TEXT, font_config=font_config)
+    md = Markdown(extensions=["extra", "toc", "tables", "fenced_code"])
+    return md, HTML, pdf_css, font_config
+
+
+# OpenAI 요청 속도 제한 (gpt-4o-mini Tier 1의 500 RPM 이하로 유지, 최대 8건까지 연속 허용)
+OPENAI_REQUESTS_PER_SECOND = 8
+OPENAI_MAX_BURST = 8
+
+# 규제별 LLM 배치 호출(abatch)의 기본 최대 동시 요청 수 (환경 변수 OPENAI_MAX_CONCURRENCY로 조정)
+DEFAULT_OPENAI_MAX_CONCURRENCY = 8
+
+
+def llm_max_concurrency() -> int:
+    """abatch에 넘길 최대 동시 요청 수를 반환합니다 (.env 로드 이후 값을 읽도록 호출 시점에 조회)."""
+    try:
+        return max(1, int(os.getenv("OPENAI_MAX_CONCURRENCY", DEFAULT_OPENAI_MAX_CONCURRENCY)))
+    except ValueError:
+        return DEFAULT_OPENAI_MAX_CONCURRENCY
+
+
+# 한 번의 LLM 호출에 함께 보내는 규제 수 (고정 지시문은 묶음당 1회만 전송, 응답 잘림 방지를 위해 제한)
+REGULATIONS_PER_PROMPT = 4
+
+
+def chunked(items: Sequence[Any], size: int) -> List[Sequence[Any]]:
+    """목록을 순서대로 size개씩 나눕니다."""
+    return [items[start:start + size] for start in range(0, len(items), size)]
+
+
+# 모든 ChatOpenAI 인스턴스가 공유하는 토큰 버킷 (동기/비동기/배치 호출 모두 적용)
+_OPENAI_RATE_LIMITER = InMemoryRateLimiter(
+    requests_per_second=OPENAI_REQUESTS_PER_SECOND,
+    check_every_n_seconds=0.05,
+    max_bucket_size=OPENAI_MAX_BURST,
+)
+
+
+# 캐시/체크포인트 DB의 기본 디렉터리 (프로젝트 루트의 cache/, 환경 변수 REGTECH_CACHE_DIR로 변경)
+PACKAGE_CACHE_DIR = Path(__file__).resolve().parent.parent / "cache"
+
+
+def default_cache_path(filename: str) -> Path:
+    """캐시 DB 파일의 기본 경로를 반환합니다 (실행 위치와 무관, 환경 변수는 호출 시점에 조회)."""
+    return Path(os.getenv("REGTECH_CACHE_DIR") or PACKAGE_CACHE_DIR) / filename
+
+
+# LLM 응답 캐시 유효 시간 (초) 및 기본 파일 이름 (환경 변수 LLM_CACHE_PATH로 경로 변경, 빈 값이면 비활성화)
+LLM_CACHE_TTL = 24 * 3600
+DEFAULT_LLM_CACHE_FILENAME = "llm_cache.sqlite3"
+
+
+class SQLiteLLMCache(BaseCache):
+    """프롬프트 + 모델 설정이 완전히 같은 LLM 호출의 응답을 SQLite에 저장하는 캐시입니다.
+
+    키는 (프롬프트, 모델/온도/response_format 등 llm_string)의 SHA-256 해시이며,
+    TTL이 지난 항목은 조회 시 무시되고 갱신 시 덮어씁니다. 실행 간/프로세스 간 공유됩니다.
+    Agent들은 응답 본문(content)만 사용하므로 생성 텍스트만 저장합니다.
+    """
+
+    def __init__(self, database_path: Union[str, Path], ttl: float = LLM_CACHE_TTL) -> None:
+        path = Path(database_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, response TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created_at FROM llm_cache WHERE key = ?",
+                (self._key(prompt, llm_string),),
+            ).fetchone()
+        if row is None or time.time() - row[1] > self._ttl:
+            return None
+        return [Generation(text=text) for text in _json_loads(row[0])]
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, created_at) VALUES (?, ?, ?)",
+                (
+                    self._key(prompt, llm_string),
+                    json.dumps([gen.text for gen in return_val], ensure_ascii=False),
+                    time.time(),
+                ),
+            )
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM llm_cache")
+
+
+@lru_cache(maxsize=1)
+def get_llm_cache() -> Optional[SQLiteLLMCache]:
+    """공용 LLM 응답 캐시를 최초 호출 시 1회 생성합니다 (LLM_CACHE_PATH가 빈 값이면 None)."""
+    database_path = os.getenv("LLM_CACHE_PATH", str(default_cache_path(DEFAULT_LLM_CACHE_FILENAME)))
+    if not database_path:
+        return None
+    try:
+        return SQLiteLLMCache(database_path)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("LLM 응답 캐시를 열 수 없어 캐시 없이 실행합니다: %s", exc)
+        return None
+
+
+# 진행 중인 OpenAI 요청 (이벤트 루프, 모델 설정, 메시지) → 응답을 기다리는 Task
+_INFLIGHT_REQUESTS: Dict[Tuple[int, str, str], "asyncio.Task[ChatResult]"] = {}
+
+
+class CoalescingChatOpenAI(ChatOpenAI):
+    """동시에 진행 중인 동일 요청(메시지 + 모델 설정)을 하나의 API 호출로 합치는 ChatOpenAI.
+
+    같은 사업 정보로 여러 워크플로우가 동시에 실행되면 응답 캐시에 결과가 저장되기 전에
+    같은 프롬프트가 중복 전송됩니다. 먼저 시작한 요청의 결과를 나머지 요청이 공유합니다.
+    """
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        key = (
+            id(asyncio.get_running_loop()),
+            self._get_llm_string(stop=stop, **kwargs),
+            json.dumps([[m.type, m.content] for m in messages], ensure_ascii=False, default=str),
+        )
+        leader = _INFLIGHT_REQUESTS.get(key)
+        if leader is not None:
+            # 응답 객체는 호출자마다 메타데이터가 채워지므로 복사본을 반환
+            result = await asyncio.shield(leader)
+            return result.model_copy(deep=True)
+
+        task = asyncio.ensure_future(
+            super()._agenerate(messages, stop=stop, run_manager=run_manager, **kwargs)
+        )
+        _INFLIGHT_REQUESTS[key] = task
+        try:
+            # 먼저 시작한 호출자가 취소되어도 기다리는 다른 호출자를 위해 요청은 계속 진행
+            return await asyncio.shield(task)
+        finally:
+            if _INFLIGHT_REQUESTS.get(key) is task:
+                del _INFLIGHT_REQUESTS[key]
+
+
+# 모델 등급: 규제 분류/체크리스트/리스크/계획은 DEFAULT, 키워드 추출·경영진 요약 같은 단순 작업은 LIGHT
+DEFAULT_LLM_MODEL = "gpt-4o-mini"
+LIGHT_LLM_MODEL = "gpt-4.1-nano"
+
+
+@lru_cache(maxsize=None)
+def get_llm(temperature: float = 0.0, model: str = DEFAULT_LLM_MODEL) -> ChatOpenAI:
+    """(온도, 모델)별 ChatOpenAI 인스턴스를 최초 호출 시 1회 생성하여 재사용합니다.
+
+    모든 Agent가 같은 HTTP 클라이언트(연결 풀)를 공유하므로 호출마다
+    클라이언트를 새로 만들지 않고 keep-alive 연결을 재사용합니다.
+    요청은 공용 rate limiter를 거쳐 429 재시도 대기가 생기기 전에 미리 조절됩니다.
+    온도 0(결정적) 호출만 공용 응답 캐시를 사용하여 프롬프트와 설정이 같으면 API를 호출하지 않고,
+    다양한 결과가 필요한 온도 0.7 호출(체크리스트, 리스크, 경영진 요약)은 캐시하지 않습니다.
+    캐시 저장 전에 동시에 들어온 같은 호출은 진행 중인 요청 하나를 공유합니다.
+    """
+    response_cache = get_llm_cache() if temperature == 0 else None
+    return CoalescingChatOpenAI(
+        model=model,
+        temperature=temperature,
+        max_retries=2,
+        rate_limiter=_OPENAI_RATE_LIMITER,
+        cache=response_cache or False,
+    )
+
+
+@lru_cache(maxsize=4)
+def build_tavily_tool(max_results: int = 8, search_depth: str = "basic") -> "TavilySearch":
+    """설정별 TavilySearch 인스턴스를 최초 호출 시 1회 생성하여 재사용합니다.
+
+    langchain_tavily는 첫 검색 시 import하며, 생성 실패(API 키 누락 등)는 캐시되지 않으므로
+    환경 변수를 설정한 뒤 다시 호출하면 정상 생성됩니다.
+    """
+    from langchain_tavily import TavilySearch
 
-def build_tavily_tool(max_results: int = 8, search_depth: str = "basic") -> TavilySearch:
-    """TavilySearch 인스턴스를 생성합니다."""
     try:
         return TavilySearch(
             max_results=max_results,
@@ -31,15 +277,14 @@ def build_tavily_tool(max_results: int = 8, search_depth: str = "basic") -> Tavi
         ) from exc
 
 
-def extract_results(payload: Any) -> List[Dict[str, Any]]:
-    """Tavily API 응답에서 결과 목록을 추출합니다."""
+def extract_results(payload: Any) -> Iterator[Dict[str, Any]]:
+    """Tavily API 응답에서 결과 항목을 순차적으로 반환합니다."""
     if isinstance(payload, dict) and "results" in payload:
-        return payload.get("results", []) or []
-    if isinstance(payload, dict) and {"title", "url"}.issubset(payload.keys()):
-        return [payload]
-    if isinstance(payload, list):
-        return payload
-    return []
+        yield from payload.get("results", []) or []
+    elif isinstance(payload, dict) and {"title", "url"}.issubset(payload.keys()):
+        yield payload
+    elif isinstance(payload, list):
+        yield from payload
 
 
 def truncate(text: str, limit: int = 300) -> str:
@@ -49,23 +294,67 @@ def truncate(text: str, limit: int = 300) -> str:
     return text[: limit - 3] + "..."
 
 
+def truncate_sentence(text: str, limit: int = 300) -> str:
+    """공백을 정리한 뒤 limit 이내의 마지막 문장 경계에서 자릅니다.
+
+    limit의 절반 이후에 문장 경계가 없으면 truncate()와 같이 글자 수로 자릅니다.
+    """
+    text = " ".join(text.split())
+    if len(text) <= limit:
+        return text
+    head = text[: limit - 3]
+    boundary = max(head.rfind(end) for end in _SENTENCE_ENDS)
+    if boundary >= limit // 2:
+        return head[: boundary + 1]
+    return head + "..."
+
+
+# 형식이 어긋난 LLM 응답을 처리할 때 발생하는 예외 (파싱 실패, 빈 배열 인덱싱, 예상과 다른 값 타입)
+# 이 예외는 해당 규제/묶음의 기본값으로 대체하며 도구 전체를 중단시키지 않음
+MALFORMED_RESPONSE_ERRORS = (json.JSONDecodeError, IndexError, ValueError, TypeError)
+
+
+def parse_llm_json(content: str) -> Any:
+    """LLM 응답 문자열에서 마크다운 코드블록을 제거하고 JSON으로 파싱합니다.
+
+    orjson이 설치되어 있으면 사용하며, 파싱 실패 시 json.JSONDecodeError를 발생시킵니다.
+    JSON 모드(response_format=json_object)는 코드블록 없는 JSON 출력을 요청할 뿐이며,
+    길이 제한으로 잘린 응답이나 캐시된 응답은 여전히 파싱에 실패할 수 있으므로
+    호출자는 MALFORMED_RESPONSE_ERRORS를 처리해야 합니다.
+    """
+    # 마크다운 코드블록 제거 (앞뒤 펜스만 제거하므로 본문 내 ```는 보존)
+    return _json_loads(_CODE_FENCE_RE.sub("", content.strip()))
+
+
+def format_source_summary(sources: List[Dict[str, Any]]) -> str:
+    """프롬프트의 [사용 가능한 출처] 블록을 만듭니다."""
+    return "\n".join([
+        f"{src.get('source_id','-')} | {src.get('title','제목 없음')}\nURL: {src.get('url','')}\n발췌: {src.get('snippet','')}"
+        for src in sources
+    ]) or "등록된 출처 없음"
+
+
 def merge_evidence(evidence_lists: List[List[EvidenceItem]]) -> List[EvidenceItem]:
     """여러 Evidence 목록을 병합하고 중복을 제거합니다."""
-    merged: List[EvidenceItem] = []
-    seen: set = set()
+    # (source_id, url) 기준으로 최초 항목만 유지 (dict는 삽입 순서 보존)
+    unique: Dict[tuple, EvidenceItem] = {}
     for items in evidence_lists:
-        for item in items or []:
+        if not items:
+            continue
+        for item in items:
             key = (item.get("source_id"), item.get("url"))
-            if key in seen:
-                continue
-            seen.add(key)
-            merged.append({
-                "source_id": item.get("source_id", ""),
-                "title": item.get("title", ""),
-                "url": item.get("url", ""),
-                "snippet": item.get("snippet", "")
-            })
-    return merged
+            if key not in unique:
+                unique[key] = item
+
+    return [
+        {
+            "source_id": item.get("source_id", ""),
+            "title": item.get("title", ""),
+            "url": item.get("url", ""),
+            "snippet": item.get("snippet", "")
+        }
+        for item in unique.values()
+    ]
 
 
 def normalize_evidence_payload(
@@ -73,9 +362,8 @@ def normalize_evidence_payload(
     source_lookup: Dict[str, Dict[str, Any]]
 ) -> List[EvidenceItem]:
     """LLM이 반환한 evidence 필드를 표준 EvidenceItem 리스트로 변환합니다."""
-    normalized: List[EvidenceItem] = []
     if not raw_evidence:
-        return normalized
+        return []
 
     if isinstance(raw_evidence, dict):
         raw_iterable = [raw_evidence]
@@ -86,63 +374,84 @@ def normalize_evidence_payload(
     else:
         raw_iterable = [raw_evidence]
 
-    for entry in raw_iterable:
+    lookup_get = source_lookup.get
+    src_match = _SRC_RE.match
+    empty_meta: Dict[str, Any] = {}
+    normalized: List[EvidenceItem] = [None] * len(raw_iterable)  # type: ignore[list-item]
+
+    for idx, entry in enumerate(raw_iterable):
         if isinstance(entry, dict):
             src_id = entry.get("source_id") or ""
             justification_text = entry.get("justification") or entry.get("excerpt") or ""
         else:
             text = str(entry)
-            match = re.match(r"(SRC-\d+)", text.strip())
+            match = src_match(text.strip())
             src_id = match.group(1) if match else ""
             justification_text = text
 
-        source_meta = source_lookup.get(src_id, {}) if src_id else {}
+        source_meta = lookup_get(src_id, empty_meta) if src_id else empty_meta
+        snippet = source_meta.get("snippet", "")
+        if len(snippet) > 300:
+            snippet = snippet[:300]
         # snippet은 원본 유지 (fallback용), justification은 LLM 요약 (우선 사용)
-        normalized.append({
+        normalized[idx] = {
             "source_id": src_id,
             "title": source_meta.get("title", ""),
             "url": source_meta.get("url", ""),
-            "snippet": source_meta.get("snippet", "")[:300],  # 원본 snippet (fallback)
+            "snippet": snippet,  # 원본 snippet (fallback)
             "justification": justification_text  # LLM이 생성한 요약 (생략 없음)
-        })
+        }
 
     return normalized
 
 
 def ensure_dict_list(payload: Any) -> List[Dict[str, Any]]:
     """LLM 응답(payload)을 Dict 리스트 형태로 강제 변환합니다."""
-    if payload is None:
-        return []
+    normalized_items: List[Dict[str, Any]] = []
+    # (값, 리스트 내 dict 여부) 스택 - 재귀 대신 명시적 스택으로 순서 유지 탐색
+    stack: List[Tuple[Any, bool]] = [(payload, False)]
 
-    if isinstance(payload, str):
-        text = payload.strip()
-        if not text:
-            return []
-        try:
-            parsed = json.loads(text)
-        except json.JSONDecodeError:
-            return []
-        return ensure_dict_list(parsed)
-
-    if isinstance(payload, dict):
-        for key in ("items", "checklists", "tasks", "data", "results"):
-            value = payload.get(key)
-            if isinstance(value, list):
-                return ensure_dict_list(value)
-        return [payload]
-
-    if isinstance(payload, list):
-        normalized_items: List[Dict[str, Any]] = []
-        for entry in payload:
-            if isinstance(entry, dict):
-                normalized_items.append(entry)
+    while stack:
+        current, is_entry = stack.pop()
+
+        if is_entry:
+            normalized_items.append(current)
+            continue
+
+        if current is None:
+            continue
+
+        if isinstance(current, str):
+            text = current.strip()
+            if not text:
+                continue
+            try:
+                stack.append((_json_loads(text), False))
+            except json.JSONDecodeError:
                 continue
-            nested_items = ensure_dict_list(entry)
-            if nested_items:
-                normalized_items.extend(nested_items)
-        return normalized_items
 
-    return []
+        elif isinstance(current, dict):
+            for key in ("items", "checklists", "tasks", "data", "results"):
+                value = current.get(key)
+                if isinstance(value, list):
+                    stack.append((value, False))
+                    break
+            else:
+                normalized_items.append(current)
+
+        elif isinstance(current, list):
+            # 리스트 안의 dict는 그대로 사용하고, 그 외 항목은 다시 변환
+            for entry in reversed(current):
+                stack.append((entry, isinstance(entry, dict)))
+
+    return normalized_items
+
+
+def _is_iterable(value: Any) -> bool:
+    """bytes를 제외한 iterable 여부 (list/tuple은 ABC 검사 없이 바로 판정)."""
+    if type(value) in (list, tuple):
+        return True
+    return isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray))
 
 
 def normalize_task_ids(value: Any) -> List[str]:
@@ -151,10 +460,9 @@ def normalize_task_ids(value: Any) -> List[str]:
         return []
 
     if isinstance(value, str):
-        tokens = [token.strip() for token in re.split(r"[,\s]+", value) if token.strip()]
-        return tokens
+        return [token for token in _TASK_SPLIT_RE.split(value) if token]
 
-    if isinstance(value, Iterable) and not isinstance(value, (bytes, bytearray)):
+    if _is_iterable(value):
         result: List[str] = []
         for item in value:
             if isinstance(item, str):
@@ -173,7 +481,7 @@ def normalize_milestones(
     default_task_ids: List[str]
 ) -> List[Milestone]:
     """마일스톤 목록을 Milestone 스키마에 맞춰 정리합니다."""
-    if not isinstance(raw_milestones, Iterable) or isinstance(raw_milestones, (str, bytes, bytearray)):
+    if isinstance(raw_milestones, str) or not _is_iterable(raw_milestones):
         return []
 
     normalized: List[Milestone] = []
@@ -243,7 +551,7 @@ def normalize_parallel_tasks(
     candidates: Iterable[Any]
     if isinstance(raw_parallel, str):
         candidates = [raw_parallel]
-    elif isinstance(raw_parallel, Iterable) and not isinstance(raw_parallel, (bytes, bytearray)):
+    elif _is_iterable(raw_parallel):
         candidates = raw_parallel
     else:
         return normalized
@@ -283,31 +591,13 @@ def save_report_pdf(markdown_text: str, output_dir: Path) -> Path:
     # 1) 원본 마크다운 저장 (존재 시 덮어쓰기)
     md_path.write_text(markdown_text, encoding="utf-8")
 
-    # 2) Markdown → HTML 변환
-    html_body = markdown(
-        markdown_text,
-        extensions=["extra", "toc", "tables", "fenced_code"],
-    )
+    md, HTML, pdf_css, font_config = _pdf_toolkit()
 
-    # 3) PDF 스타일 정의
-    css = CSS(
-        string="""
-        @page { size: A4; margin: 20mm; }
-        body { font-family: 'Apple SD Gothic Neo', 'Nanum Gothic', 'Noto Sans CJK KR', sans-serif; font-size: 11pt; line-height: 1.6; }
-        h1, h2, h3 { color: #1a237e; }
-        h1 { border-bottom: 3px solid #1a237e; padding-bottom: 10px; }
-        h2 { border-bottom: 1px solid #9fa8da; padding-bottom: 5px; margin-top: 20px; }
-        ul { margin-left: 0; padding-left: 15px; }
-        li { margin-bottom: 6px; }
-        table { border-collapse: collapse; width: 100%; margin: 12px 0; }
-        th, td { border: 1px solid #bdbdbd; padding: 8px; text-align: left; }
-        th { background-color: #e8eaf6; font-weight: bold; }
-        code, pre { background: #f5f5f5; padding: 2px 4px; border-radius: 3px; }
-        blockquote { border-left: 4px solid #1a237e; padding-left: 10px; color: #555; }
-        """
-    )
+    # 2) Markdown → HTML 변환
+    with _MD_LOCK:
+        html_body = md.reset().convert(markdown_text)
 
-    # 4) HTML 문서 완성 및 PDF 저장 (동일 이름 존재 시 자동 덮어쓰기)
+    # 3) HTML 문서 완성 및 PDF 저장 (동일 이름 존재 시 자동 덮어쓰기)
     html_doc = f"""
     <html>
       <head>
@@ -318,10 +608,14 @@ def save_report_pdf(markdown_text: str, output_dir: Path) -> Path:
     </html>
     """
 
-    HTML(string=html_doc).write_pdf(target=str(pdf_path), stylesheets=[css])
+    HTML(string=html_doc).write_pdf(
+        target=str(pdf_path),
+        stylesheets=[pdf_css],
+        font_config=font_config,
+    )
 
-    print(f"✓ PDF 보고서 저장: {pdf_path}")
-    print(f"✓ Markdown 보고서 저장: {md_path}")
+    logger.info("✓ PDF 보고서 저장: %s", pdf_path)
+    logger.info("✓ Markdown 보고서 저장: %s", md_path)
 
     return pdf_path
 
@@ -335,12 +629,24 @@ def format_evidence_link(evidence: Dict[str, Any]) -> str:
     Returns:
         포맷된 마크다운 링크 문자열
     """
-    # hostname 추출 및 표시 이름 정리
     url = (evidence.get('url') or '').strip()
-    parsed = urlparse(url) if url else None
-    hostname = parsed.hostname if parsed else None
-
     raw_title = (evidence.get('title') or '').strip()
+    # justification 우선 사용 (LLM 요약), 없으면 snippet 사용
+    summary = evidence.get('justification') or (evidence.get('snippet') or "").replace('\n', ' ')
+    return _format_evidence_link(url, raw_title, summary)
+
+
+@lru_cache(maxsize=4096)
+def _url_hostname(url: str) -> Optional[str]:
+    """URL의 hostname을 반환합니다 (동일 URL 반복 파싱 방지)."""
+    return urlparse(url).hostname
+
+
+@lru_cache(maxsize=2048)
+def _format_evidence_link(url: str, raw_title: str, summary: str) -> str:
+    """format_evidence_link의 캐시된 구현 (동일 출처가 여러 섹션에서 반복됨)."""
+    # hostname 추출 및 표시 이름 정리
+    hostname = _url_hostname(url) if url else None
 
     def _clean_hostname(candidate: str) -> str:
         if candidate:
@@ -359,8 +665,6 @@ def format_evidence_link(evidence: Dict[str, Any]) -> str:
         link_title = hostname
     if not link_title:
         link_title = 'Unknown'
-    # justification 우선 사용 (LLM 요약), 없으면 snippet 사용
-    summary = evidence.get('justification') or (evidence.get('snippet') or "").replace('\n', ' ')
 
     if url:
         return f"**[<a href=\"{url}\">{link_title}</a>]**\t{summary}"
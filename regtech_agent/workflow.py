@@ -2,24 +2,98 @@
 LangGraph Workflow 빌드 및 실행
 """
 
-from typing import Optional, Sequence, Union
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import uuid
+from contextlib import aclosing
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Set, Tuple, Union
 
+from langchain_core.runnables import RunnableLambda
+from langgraph.cache.base import BaseCache
+from langgraph.cache.memory import InMemoryCache
+from langgraph.cache.sqlite import SqliteCache
+from langgraph.checkpoint.sqlite import SqliteSaver
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
 from langgraph.graph import StateGraph, START, END
-from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import CachePolicy
 
 from .models import AgentState, BusinessInfo
+from .utils import default_cache_path
 from .nodes import (
     analyzer_node,
+    aanalyzer_node,
     search_node,
+    asearch_node,
     classifier_node,
+    aclassifier_node,
     prioritizer_node,
+    aprioritizer_node,
     checklist_generator_node,
+    achecklist_generator_node,
     planning_agent_node,
+    aplanning_agent_node,
     risk_assessor_node,
+    arisk_assessor_node,
     report_generator_node,
+    areport_generator_node,
     email_notifier_node,
+    aemail_notifier_node,
 )
 
+logger = logging.getLogger(__name__)
+
+# 노드 결과 캐시 유효 시간 (초)
+NODE_CACHE_TTL = 24 * 3600
+
+# 노드 결과 캐시 DB 기본 파일 이름 (환경 변수 NODE_CACHE_PATH로 경로 변경, 빈 값이면 프로세스 내 메모리 캐시)
+DEFAULT_NODE_CACHE_FILENAME = "node_cache.sqlite3"
+
+# 캐시 키 버전 (프롬프트나 출력 형식을 바꾸면 올려서 이전 결과를 무효화)
+NODE_CACHE_VERSION = "2"
+
+
+def _build_node_cache() -> BaseCache:
+    """실행(프로세스) 간 공유되는 노드 결과 캐시를 생성합니다 (_get_app()에서 1회 호출).
+
+    같은 사업 정보로 다시 실행하면 analyzer/searcher/classifier 결과를
+    SQLite에서 바로 반환하여 LLM·Tavily 호출 비용과 지연을 없앱니다.
+    """
+    database_path = os.getenv("NODE_CACHE_PATH", str(default_cache_path(DEFAULT_NODE_CACHE_FILENAME)))
+    if not database_path:
+        return InMemoryCache()
+    try:
+        Path(database_path).parent.mkdir(parents=True, exist_ok=True)
+        return SqliteCache(path=database_path)
+    except (OSError, sqlite3.Error) as exc:
+        logger.warning("노드 결과 캐시를 열 수 없어 메모리 캐시로 실행합니다: %s", exc)
+        return InMemoryCache()
+
+
+
+def _state_cache_key(*fields: str) -> Callable[[Dict[str, Any]], str]:
+    """노드가 실제로 읽는 상태 필드만으로 캐시 키를 만드는 함수를 반환합니다.
+
+    키를 정렬한 JSON으로 직렬화하므로 필드 순서가 달라도 같은 키가 됩니다.
+    """
+    def key_func(state: Dict[str, Any]) -> str:
+        payload = json.dumps(
+            {"version": NODE_CACHE_VERSION, **{field: state.get(field) for field in fields}},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+    return key_func
+
 
 def build_workflow() -> StateGraph:
     """LangGraph 워크플로우를 구성합니다 (병렬 처리 최적화).
@@ -38,19 +112,59 @@ def build_workflow() -> StateGraph:
 
     병렬화 이점: Risk Assessment Agent가 Checklist Generator/Planning Agent와
                 동시 실행되어 전체 소요 시간 약 30초~1분 단축
+
+    노드 내부 팬아웃: searcher는 키워드 그룹별 Tavily 쿼리를, checklist_generator와
+                risk_assessor는 규제별 LLM 호출을 동시에 실행합니다. 출처 ID 부여와
+                URL 중복 제거가 전체 결과를 기준으로 이뤄지므로 Send 워커로 나누지 않습니다.
+
+    동기/비동기 실행: 각 노드와 에이전트 도구는 동기 함수와 코루틴을 함께 가집니다.
+                invoke()는 동기 LangChain/Tavily/smtplib 호출을 사용하고 (팬아웃은
+                batch()로 스레드 풀에서 실행), ainvoke()는 호출자의 이벤트 루프에서
+                abatch()/aiosmtplib 코루틴을 사용합니다. 두 경로는 프롬프트 준비와
+                응답 파싱 헬퍼를 공유하므로 결과가 같습니다.
     """
     graph = StateGraph(AgentState)
 
-    # Agent 노드 추가
-    graph.add_node("analyzer", analyzer_node)
-    graph.add_node("searcher", search_node)
-    graph.add_node("classifier", classifier_node)
-    graph.add_node("prioritizer", prioritizer_node)
-    graph.add_node("checklist_generator", checklist_generator_node)
-    graph.add_node("risk_assessor", risk_assessor_node)
-    graph.add_node("planning_agent", planning_agent_node)
-    graph.add_node("report_generator", report_generator_node)
-    graph.add_node("email_notifier", email_notifier_node)
+    # Agent 노드 추가 (입력이 같으면 결과가 같은 앞단 노드는 캐시)
+    graph.add_node(
+        "analyzer",
+        RunnableLambda(analyzer_node, afunc=aanalyzer_node),
+        cache_policy=CachePolicy(key_func=_state_cache_key("business_info"), ttl=NODE_CACHE_TTL),
+    )
+    graph.add_node(
+        "searcher",
+        RunnableLambda(search_node, afunc=asearch_node),
+        cache_policy=CachePolicy(key_func=_state_cache_key("keywords"), ttl=NODE_CACHE_TTL),
+    )
+    graph.add_node(
+        "classifier",
+        RunnableLambda(classifier_node, afunc=aclassifier_node),
+        cache_policy=CachePolicy(
+            key_func=_state_cache_key("business_info", "search_results"),
+            ttl=NODE_CACHE_TTL,
+        ),
+    )
+    graph.add_node("prioritizer", RunnableLambda(prioritizer_node, afunc=aprioritizer_node))
+    graph.add_node(
+        "checklist_generator",
+        RunnableLambda(checklist_generator_node, afunc=achecklist_generator_node),
+    )
+    graph.add_node(
+        "risk_assessor",
+        RunnableLambda(risk_assessor_node, afunc=arisk_assessor_node),
+    )
+    graph.add_node(
+        "planning_agent",
+        RunnableLambda(planning_agent_node, afunc=aplanning_agent_node),
+    )
+    graph.add_node(
+        "report_generator",
+        RunnableLambda(report_generator_node, afunc=areport_generator_node),
+    )
+    graph.add_node(
+        "email_notifier",
+        RunnableLambda(email_notifier_node, afunc=aemail_notifier_node),
+    )
 
     # 엣지 추가: 순차 실행 (Prioritizer까지)
     graph.add_edge(START, "analyzer")
@@ -65,9 +179,9 @@ def build_workflow() -> StateGraph:
     # Checklist Generator → Planning Agent (순차)
     graph.add_edge("checklist_generator", "planning_agent")
 
-    # Report Generator는 Planning Agent와 Risk Assessor 모두 완료 후 실행
-    graph.add_edge("planning_agent", "report_generator")
-    graph.add_edge("risk_assessor", "report_generator")
+    # Report Generator는 Planning Agent와 Risk Assessor 모두 완료 후 1회만 실행
+    # (개별 엣지 2개는 각 부모가 끝날 때마다 보고서를 다시 생성하므로 조인 엣지 사용)
+    graph.add_edge(["planning_agent", "risk_assessor"], "report_generator")
 
     graph.add_edge("report_generator", "email_notifier")
     graph.add_edge("email_notifier", END)
@@ -75,63 +189,107 @@ def build_workflow() -> StateGraph:
     return graph
 
 
-def run_regulation_agent(
-    business_info: BusinessInfo,
-    email_recipient: Optional[Union[str, Sequence[str]]] = None,
-) -> AgentState:
-    """규제 AI Agent를 실행합니다.
+# 초기 상태의 결과 필드 기본값 (읽기 전용 템플릿, 실행마다 얕은 복사해 사용)
+# 노드는 이 필드들을 부분 갱신으로 통째로 교체하며 내부 리스트를 직접 수정하지 않음
+_INITIAL_RISK_ASSESSMENT = MappingProxyType({
+    "total_risk_score": 0.0,
+    "high_risk_items": [],
+    "risk_matrix": {},
+    "recommendations": []
+})
+_INITIAL_FINAL_REPORT = MappingProxyType({
+    "executive_summary": "",
+    "key_insights": [],
+    "action_items": [],
+    "risk_highlights": [],
+    "next_steps": [],
+    "full_markdown": "",
+    "report_pdf_path": "",
+    "citations": []
+})
 
-    Args:
-        business_info: 사업 정보
-        email_recipient: 이메일 수신자 목록 (문자열 또는 쉼표 구분 문자열)
 
-    Returns:
-        최종 상태 객체 (분석 결과 포함)
-    """
-    workflow = build_workflow()
-    app = workflow.compile(checkpointer=MemorySaver())
+def _normalize_recipients(value: Optional[Union[str, Sequence[str]]]) -> list[str]:
+    recipients: list[str] = []
+    if value is None:
+        return recipients
+    if isinstance(value, str):
+        recipients.extend([token.strip() for token in value.split(",") if token.strip()])
+        return recipients
+    for entry in value:
+        if entry is None:
+            continue
+        text = str(entry)
+        recipients.extend([token.strip() for token in text.split(",") if token.strip()])
+    return recipients
+
+
+# 정렬하여 프롬프트에 넣는 사업 정보 목록 필드 (processes도 입력 순서와 무관하게 같은 프롬프트가 되도록 포함)
+_UNORDERED_BUSINESS_FIELDS = ("processes", "sales_channels", "export_countries")
+
+
+def _normalize_business_info(business_info: BusinessInfo) -> BusinessInfo:
+    """입력 순서만 다른 같은 사업 정보가 같은 프롬프트/캐시 키/thread_id가 되도록 정규화합니다.
 
-    def normalize_recipients(value: Optional[Union[str, Sequence[str]]]) -> list[str]:
-        recipients: list[str] = []
-        if value is None:
-            return recipients
+    문자열 앞뒤 공백을 제거하고, 순서에 의미가 없는 목록은 중복 제거 후 정렬합니다.
+    """
+    normalized: Dict[str, Any] = {}
+    for field, value in business_info.items():
         if isinstance(value, str):
-            recipients.extend([token.strip() for token in value.split(",") if token.strip()])
-            return recipients
-        for entry in value:
-            if entry is None:
-                continue
-            text = str(entry)
-            recipients.extend([token.strip() for token in text.split(",") if token.strip()])
-        return recipients
+            value = value.strip()
+        elif isinstance(value, (list, tuple)):
+            value = [item.strip() if isinstance(item, str) else item for item in value]
+            if field in _UNORDERED_BUSINESS_FIELDS:
+                value = sorted(set(value), key=str)
+        normalized[field] = value
+    return normalized
+
+
+# 체크포인트 DB 기본 파일 이름 (환경 변수 CHECKPOINT_DB_PATH로 경로 변경)
+DEFAULT_CHECKPOINT_DB_FILENAME = "agent_state.sqlite3"
+
+
+def _checkpoint_db_path() -> Path:
+    path = Path(os.getenv("CHECKPOINT_DB_PATH") or default_cache_path(DEFAULT_CHECKPOINT_DB_FILENAME))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
 
-    normalized_recipients = normalize_recipients(email_recipient)
+
+@lru_cache(maxsize=1)
+def _get_app() -> Tuple[CompiledStateGraph, SqliteSaver]:
+    """(컴파일된 그래프, 동기 체크포인터)를 첫 실행 시 1회 생성하여 재사용합니다.
+
+    노드가 끝날 때마다 SQLite에 상태를 기록하여 중단 시 마지막 완료 노드부터 재개합니다.
+    모델/도구만 import하는 경우 DB 파일을 만들지 않도록 체크포인트 DB와 노드 결과 캐시는
+    모듈 로드 시가 아니라 여기서 엽니다.
+    SqliteSaver는 내부 잠금으로 연결 사용을 직렬화하므로 스레드 간에 공유해도 안전합니다.
+    """
+    checkpointer = SqliteSaver(sqlite3.connect(str(_checkpoint_db_path()), check_same_thread=False))
+    app = build_workflow().compile(checkpointer=checkpointer, cache=_build_node_cache())
+    return app, checkpointer
+
+
+# 현재 프로세스에서 실행 중인 thread_id (같은 입력의 동시 실행이 체크포인트를 공유하지 않도록)
+_ACTIVE_THREADS: Set[str] = set()
+_ACTIVE_THREADS_LOCK = threading.Lock()
+
+
+def _build_initial_state(
+    business_info: BusinessInfo,
+    email_recipient: Optional[Union[str, Sequence[str]]],
+) -> AgentState:
+    normalized_recipients = _normalize_recipients(email_recipient)
 
     initial_state: AgentState = {
-        "business_info": business_info,
+        "business_info": _normalize_business_info(business_info),
         "keywords": [],
         "search_results": [],
         "regulations": [],
-        "final_output": {},
         # Agent 결과 필드 초기화
         "checklists": [],
         "execution_plans": [],
-        "risk_assessment": {
-            "total_risk_score": 0.0,
-            "high_risk_items": [],
-            "risk_matrix": {},
-            "recommendations": []
-        },
-        "final_report": {
-            "executive_summary": "",
-            "key_insights": [],
-            "action_items": [],
-            "risk_highlights": [],
-            "next_steps": [],
-            "full_markdown": "",
-            "report_pdf_path": "",
-            "citations": []
-        },
+        "risk_assessment": dict(_INITIAL_RISK_ASSESSMENT),
+        "final_report": dict(_INITIAL_FINAL_REPORT),
         "email_status": {
             "success": False,
             "recipients": normalized_recipients,
@@ -143,16 +301,164 @@ def run_regulation_agent(
         "email_recipient": normalized_recipients[0] if normalized_recipients else None,
         "email_recipients": normalized_recipients,
     }
+    return initial_state
+
+
+def _claim_thread_config(initial_state: AgentState) -> Dict[str, Any]:
+    """입력(사업 정보 + 수신자)에서 결정적인 thread_id를 만들어 실행 설정을 반환합니다.
 
-    print("🚀 [RegTech Agent] Workflow 시작...\n")
-    print("=" * 80)
-    print()
+    같은 입력으로 다시 실행하면 같은 thread_id가 되어 중단된 실행을 이어서 진행합니다.
+    같은 입력이 이 프로세스에서 이미 실행 중이면 고유 thread_id를 사용합니다.
+    """
+    payload = json.dumps(
+        {
+            "business_info": initial_state["business_info"],
+            "email_recipients": initial_state["email_recipients"],
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+        default=str,
+    )
+    digest = hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+    thread_id = f"regulation_agent_v3-{digest}"
+    with _ACTIVE_THREADS_LOCK:
+        if thread_id in _ACTIVE_THREADS:
+            thread_id = f"{thread_id}-{uuid.uuid4().hex}"
+        _ACTIVE_THREADS.add(thread_id)
+    return {"configurable": {"thread_id": thread_id}}
+
+
+def _release_thread(config: Dict[str, Any]) -> None:
+    with _ACTIVE_THREADS_LOCK:
+        _ACTIVE_THREADS.discard(config["configurable"]["thread_id"])
+
+
+def run_regulation_agent(
+    business_info: BusinessInfo,
+    email_recipient: Optional[Union[str, Sequence[str]]] = None,
+) -> AgentState:
+    """규제 AI Agent를 실행합니다.
+
+    Args:
+        business_info: 사업 정보
+        email_recipient: 이메일 수신자 목록 (문자열 또는 쉼표 구분 문자열)
+
+    Returns:
+        최종 상태 객체 (분석 결과 포함)
+    """
+    initial_state = _build_initial_state(business_info, email_recipient)
+
+    logger.info("🚀 [RegTech Agent] Workflow 시작...")
+    logger.info("=" * 80)
 
-    config = {"configurable": {"thread_id": "regulation_agent_v3"}}
-    final_state = app.invoke(initial_state, config=config)
+    config = _claim_thread_config(initial_state)
+    thread_id = config["configurable"]["thread_id"]
+    app, checkpointer = _get_app()
+    try:
+        snapshot = app.get_state(config)
+        if snapshot.next:
+            # 이전 실행이 중단된 지점(완료된 노드 이후)부터 재개
+            logger.info("♻️  중단된 실행을 재개합니다: %s", ", ".join(snapshot.next))
+            final_state = app.invoke(None, config=config)
+        else:
+            if snapshot.values:
+                checkpointer.delete_thread(thread_id)
+            final_state = app.invoke(initial_state, config=config)
+        # 정상 완료된 실행 기록은 정리 (실패 시에는 재개를 위해 남겨 둠)
+        checkpointer.delete_thread(thread_id)
+    finally:
+        _release_thread(config)
 
-    print()
-    print("=" * 80)
-    print("✅ [RegTech Agent] Workflow 완료!\n")
+    logger.info("=" * 80)
+    logger.info("✅ [RegTech Agent] Workflow 완료!")
 
     return final_state
+
+
+async def astream_regulation_agent(
+    business_info: BusinessInfo,
+    email_recipient: Optional[Union[str, Sequence[str]]] = None,
+) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """규제 AI Agent를 비동기로 실행하며 노드가 끝날 때마다 결과를 전달합니다 (app.astream).
+
+    전체 워크플로우가 끝나기 전에 (노드 이름, 상태 업데이트)를 순서대로 내보내므로
+    UI나 로그에서 앞단 결과(키워드, 검색 결과, 규제 목록 등)를 먼저 보여줄 수 있습니다.
+    마지막에는 (END, 최종 상태)를 내보냅니다.
+
+    생성기가 실행되는 동안 체크포인트 DB 연결과 thread_id 점유가 유지되므로, 끝까지 읽지 않고
+    중단하는 호출자는 반드시 ``contextlib.aclosing(...)``으로 감싸거나 ``aclose()``를 호출해야 합니다.
+    그렇지 않으면 가비지 컬렉션 전까지 같은 입력의 다음 실행이 이 실행을 재개하지 못합니다.
+
+    Args:
+        business_info: 사업 정보
+        email_recipient: 이메일 수신자 목록 (문자열 또는 쉼표 구분 문자열)
+
+    Yields:
+        (노드 이름, 해당 노드의 상태 업데이트), 마지막은 (END, 최종 상태 객체)
+    """
+    initial_state = _build_initial_state(business_info, email_recipient)
+
+    logger.info("🚀 [RegTech Agent] Workflow 시작...")
+    logger.info("=" * 80)
+
+    config = _claim_thread_config(initial_state)
+    thread_id = config["configurable"]["thread_id"]
+    try:
+        async with AsyncSqliteSaver.from_conn_string(str(_checkpoint_db_path())) as checkpointer:
+            # 컴파일된 그래프를 재사용하고 체크포인터만 이 실행의 비동기 연결로 교체
+            app = _get_app()[0].copy(update={"checkpointer": checkpointer})
+            snapshot = await app.aget_state(config)
+            if snapshot.next:
+                # 이전 실행이 중단된 지점(완료된 노드 이후)부터 재개
+                logger.info("♻️  중단된 실행을 재개합니다: %s", ", ".join(snapshot.next))
+                graph_input = None
+            else:
+                if snapshot.values:
+                    await checkpointer.adelete_thread(thread_id)
+                graph_input = initial_state
+
+            final_state = None
+            async for mode, chunk in app.astream(
+                graph_input, config=config, stream_mode=["updates", "values"]
+            ):
+                if mode == "values":
+                    final_state = chunk
+                    continue
+                for node, update in chunk.items():
+                    # "__metadata__"(캐시 적중 여부 등)는 노드 결과가 아니므로 제외
+                    if not node.startswith("__"):
+                        yield node, update
+
+            # 정상 완료된 실행 기록은 정리 (실패 시에는 재개를 위해 남겨 둠)
+            await checkpointer.adelete_thread(thread_id)
+    finally:
+        _release_thread(config)
+
+    logger.info("=" * 80)
+    logger.info("✅ [RegTech Agent] Workflow 완료!")
+
+    yield END, final_state
+
+
+async def arun_regulation_agent(
+    business_info: BusinessInfo,
+    email_recipient: Optional[Union[str, Sequence[str]]] = None,
+) -> AgentState:
+    """규제 AI Agent를 비동기로 실행합니다 (app.astream).
+
+    LLM/Tavily/SMTP 대기 중 이벤트 루프를 점유하지 않으므로, 웹 서버 등에서
+    하나의 이벤트 루프로 여러 워크플로우를 동시에 처리할 수 있습니다.
+
+    Args:
+        business_info: 사업 정보
+        email_recipient: 이메일 수신자 목록 (문자열 또는 쉼표 구분 문자열)
+
+    Returns:
+        최종 상태 객체 (분석 결과 포함)
+    """
+    # 중간에 예외/취소가 나도 체크포인트 연결과 thread_id 점유가 즉시 해제되도록 생성기를 명시적으로 닫음
+    async with aclosing(astream_regulation_agent(business_info, email_recipient)) as stream:
+        async for node, payload in stream:
+            if node == END:
+                return payload
+    raise RuntimeError("워크플로우가 최종 상태 없이 종료되었습니다.")
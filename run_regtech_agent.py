@@ -2,11 +2,18 @@
 RegTech Agent 메인 실행 파일 (리팩토링 버전)
 """
 
+import asyncio
 import json
+import logging
 import sys
 from dotenv import load_dotenv
 
-from regtech_agent import BusinessInfo, run_regulation_agent
+from regtech_agent import BusinessInfo, arun_regulation_agent
+
+try:
+    import orjson
+except ImportError:  # orjson 미설치 시 표준 json 사용
+    orjson = None
 
 # 환경 변수 로드
 load_dotenv()
@@ -15,10 +22,17 @@ load_dotenv()
 def main():
     """메인 실행 함수"""
 
-    print("=" * 80)
-    print("RegTech Assistant - 규제 준수 분석 AI Agent")
-    print("=" * 80)
-    print()
+    # Agent 진행 로그를 콘솔에 출력 (서비스 환경에서는 로깅 설정에 따름)
+    logging.basicConfig(stream=sys.stdout, format="%(message)s")
+    logging.getLogger("regtech_agent").setLevel(logging.INFO)
+
+    # 헤더는 워크플로우 진행 로그보다 먼저 보이도록 실행 전에 한 번에 출력
+    sys.stdout.write(
+        "=" * 80 + "\n"
+        + "RegTech Assistant - 규제 준수 분석 AI Agent\n"
+        + "=" * 80 + "\n\n"
+    )
+    sys.stdout.flush()
 
     # 샘플 사업 정보
     sample_business_info: BusinessInfo = {
@@ -32,11 +46,11 @@ def main():
     }
     recipient_email = sys.argv[1] if len(sys.argv) > 1 else None
 
-    # Workflow 실행
-    final_state = run_regulation_agent(
+    # Workflow 실행 (ainvoke: 노드 내부의 LLM/Tavily 호출을 하나의 이벤트 루프에서 처리)
+    final_state = asyncio.run(arun_regulation_agent(
         business_info=sample_business_info,
         email_recipient=recipient_email,
-    )
+    ))
 
     # 결과 저장
     output_file = "regulation_analysis_result.json"
@@ -53,41 +67,55 @@ def main():
         "email_status": final_state.get("email_status", {}),
     }
 
-    with open(output_file, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2, default=str)
-
-    print(f"📊 분석 결과 저장: {output_file}")
+    if orjson is not None:
+        # UTF-8 바이트로 직접 직렬화 (들여쓰기 2칸, 직렬화 불가 값은 str 변환)
+        with open(output_file, "wb") as f:
+            f.write(orjson.dumps(
+                output_data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str,
+            ))
+    else:
+        with open(output_file, "w", encoding="utf-8") as f:
+            json.dump(output_data, f, ensure_ascii=False, indent=2, default=str)
+
+    # 결과 요약 출력 줄 모음
+    out: list[str] = []
+    out.append(f"📊 분석 결과 저장: {output_file}")
 
     # 보고서 정보 출력
     if "final_report" in final_state:
         report = final_state["final_report"]
-        print(f"\n📄 보고서 파일:")
-        print(f"   - PDF: {report.get('report_pdf_path')}")
-        print(f"   - Markdown: report/regulation_report_reason.md")
+        out.append(f"\n📄 보고서 파일:")
+        out.append(f"   - PDF: {report.get('report_pdf_path')}")
+        out.append(f"   - Markdown: report/regulation_report_reason.md")
 
     email_status = final_state.get("email_status", {})
     if email_status:
         status_icon = "✅" if email_status.get("success") else "⚠️"
         recipients = email_status.get("recipients") or []
         recipient = ", ".join(recipients) if recipients else "미지정"
-        print("\n📧 이메일 발송 결과:")
-        print(f"   {status_icon} 수신자: {recipient}")
+        out.append("\n📧 이메일 발송 결과:")
+        out.append(f"   {status_icon} 수신자: {recipient}")
         if email_status.get("errors"):
             for error in email_status["errors"]:
-                print(f"   오류: {error}")
+                out.append(f"   오류: {error}")
         if email_status.get("details"):
             for detail in email_status["details"]:
                 icon = "✅" if detail.get("success") else "❌"
                 target = detail.get("recipient") or detail.get("input") or "알 수 없음"
                 message = detail.get("error")
                 if message:
-                    print(f"   {icon} {target} → {message}")
+                    out.append(f"   {icon} {target} → {message}")
                 else:
-                    print(f"   {icon} {target} 전송 완료")
+                    out.append(f"   {icon} {target} 전송 완료")
+
+    out.append("\n" + "=" * 80)
+    out.append("🎉 완료! 생성된 보고서를 확인하세요.")
+    out.append("=" * 80)
 
-    print("\n" + "=" * 80)
-    print("🎉 완료! 생성된 보고서를 확인하세요.")
-    print("=" * 80)
+    # 결과 요약은 한 번에 출력 (줄마다 print 하지 않음)
+    sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":